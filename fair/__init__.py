@@ -49,3 +49,20 @@ __copyright__ = "Copyright 2021, SCRC"
 import logging
 
 logging.basicConfig()
+
+
+def __getattr__(name: str) -> str:
+    # The version is read from the installed package metadata only when it
+    # is requested, rather than on every import of the package
+    if name != "__version__":
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    import importlib.metadata
+
+    try:
+        _version = importlib.metadata.version("fair-cli")
+    except importlib.metadata.PackageNotFoundError:
+        _version = "unknown"
+
+    globals()["__version__"] = _version
+    return _version
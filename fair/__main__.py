@@ -0,0 +1,44 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+
+Module Entry Point
+==================
+
+Allows the command line interface to be run as 'python -m fair'.
+
+Contents
+========
+
+Functions
+---------
+
+    main - run the FAIR-CLI command line interface
+"""
+
+
+import sys
+
+
+def main() -> None:
+    """Run the FAIR-CLI command line interface"""
+    # The version is reported without building the command line interface,
+    # if the package metadata is missing Click reports the error as usual
+    if sys.argv[1:] == ["--version"]:
+        import importlib.metadata
+
+        try:
+            _version = importlib.metadata.version("fair-cli")
+        except importlib.metadata.PackageNotFoundError:
+            pass
+        else:
+            print(f"fair, version {_version}")
+            return
+
+    from fair.cli import cli
+
+    cli(obj={}, prog_name="fair")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,25 +11,16 @@ interact with the synchronisation tool.
 
 __date__ = "2021-06-24"
 
-import glob
+import functools
+import itertools
+import json
 import logging
-from multiprocessing import context
 import os
-import pathlib
 import sys
 import typing
 
 import click
 import click.shell_completion
-import yaml
-
-import fair.common as fdp_com
-import fair.configuration as fdp_conf
-import fair.exceptions as fdp_exc
-import fair.history as fdp_hist
-import fair.registry.server as fdp_svr
-import fair.run as fdp_run
-import fair.session as fdp_session
 
 __author__ = "Scottish COVID Response Consortium"
 __credits__ = [
@@ -44,38 +35,98 @@ __status__ = "Development"
 __copyright__ = "Copyright 2021, FAIR Data Pipeline"
 
 
+# Maximum number of candidates offered when completing a file path
+_MAX_COMPLETIONS = 200
+
+# Directories never searched for YAML files unless the typed path enters them,
+# including the FAIR repository folder (fdp_com.FAIR_FOLDER) holding job data
+_COMPLETION_IGNORE_DIRS = frozenset(
+    {".fair", ".git", "__pycache__", "node_modules", ".venv", ".tox"}
+)
+
+
+def _walk_yamls(incomplete: str) -> typing.Iterator[str]:
+    """Yield YAML files below the working directory starting with a prefix
+
+    Directories which cannot contain a match for the prefix are not entered.
+    Candidates are absolute paths if an absolute prefix is given, else paths
+    relative to the working directory, keeping any leading './' typed.
+    """
+    _cwd = os.getcwd()
+    _lead = ""
+    _dot_prefix = os.path.join(os.curdir, "")
+    while incomplete.startswith(_dot_prefix):
+        _lead += _dot_prefix
+        incomplete = incomplete[len(_dot_prefix):]
+    _strip = 0 if os.path.isabs(incomplete) else len(os.path.join(_cwd, ""))
+    _stack = [_cwd]
+    while _stack:
+        try:
+            _entries = os.scandir(_stack.pop())
+        except OSError:
+            continue
+        with _entries:
+            for entry in _entries:
+                _path = entry.path[_strip:]
+                # Directory entries carry their type so no stat is needed
+                if entry.is_dir(follow_symlinks=False):
+                    _dir = os.path.join(_path, "")
+                    if incomplete.startswith(_dir) or (
+                        _path.startswith(incomplete)
+                        and entry.name not in _COMPLETION_IGNORE_DIRS
+                    ):
+                        _stack.append(entry.path)
+                elif entry.name.endswith((".yaml", ".yml")) and _path.startswith(
+                    incomplete
+                ):
+                    yield f"{_lead}{_path}"
+
+
 def complete_yamls(ctx, param, incomplete):
-    _file_list: typing.List[str] = [
-        str(i) for i in pathlib.Path(os.getcwd()).rglob("*.yaml")
-    ]
-    _file_list += [str(i) for i in pathlib.Path(os.getcwd()).rglob("*.yml")]
     return [
         click.shell_completion.CompletionItem(k)
-        for k in _file_list
-        if k.startswith(incomplete)
+        for k in itertools.islice(_walk_yamls(incomplete), _MAX_COMPLETIONS)
     ]
 
 
 def complete_data_products(ctx, param, incomplete) -> typing.List[str]:
+    import fair.common as fdp_com
+
+    # Completion runs on every key press so the staging file is read from
+    # its JSON copy where this is up to date, else the YAML is parsed with
+    # the fastest available loader
     _staging_file = fdp_com.staging_cache(os.getcwd())
-    if not os.path.exists(_staging_file):
+    _staging_json = f"{_staging_file}{fdp_com.STAGING_JSON_SUFFIX}"
+    try:
+        _use_json = (
+            os.stat(_staging_json).st_mtime_ns
+            >= os.stat(_staging_file).st_mtime_ns
+        )
+    except FileNotFoundError:
+        _use_json = False
+    try:
+        if _use_json:
+            with open(_staging_json, mode="rb") as in_f:
+                _staging_data = json.load(in_f)
+        else:
+            _staging_data = fdp_com.read_yaml(_staging_file)
+    except FileNotFoundError:
         return []
-    _staging_data = yaml.safe_load(open(_staging_file, encoding='utf-8'))
-    _candidates = list(_staging_data["data_product"].keys())
+    _matches = (c for c in _staging_data["data_product"] if c.startswith(incomplete))
     return [
         click.shell_completion.CompletionItem(c)
-        for c in _candidates
-        if c.startswith(incomplete)
+        for c in itertools.islice(_matches, _MAX_COMPLETIONS)
     ]
 
 
 def complete_jobs(ctx, param, incomplete) -> typing.List[str]:
+    import fair.history as fdp_hist
+    import fair.run as fdp_run
+
     _log_dir = fdp_hist.history_directory(os.getcwd())
-    _job_dir = fdp_com.default_jobs_dir()
-    if not os.path.isdir(_log_dir) or not os.path.isdir(_job_dir):
+    if not os.path.isdir(_log_dir):
         return []
-    _job_dirs = glob.glob(os.path.join(_job_dir, "*"))
-    _jobs = [fdp_run.get_job_hash(jd) for jd in _job_dirs]
+    _jobs = fdp_run.get_job_hashes()
     return [
         click.shell_completion.CompletionItem(j)
         for j in _jobs
@@ -83,49 +134,97 @@ def complete_jobs(ctx, param, incomplete) -> typing.List[str]:
     ]
 
 
+def _handle_fair_exceptions(func: typing.Callable) -> typing.Callable:
+    """Report FAIR-CLI exceptions raised by a command and exit on errors"""
+
+    @functools.wraps(func)
+    def _wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            import fair.exceptions as fdp_exc
+            if not isinstance(e, fdp_exc.FAIRCLIException):
+                raise
+            e.err_print()
+            if e.level.lower() == "error":
+                sys.exit(e.exit_code)
+
+    return _wrapper
+
+
+def _user_config_path(config: typing.Tuple[str], cwd: str) -> str:
+    """Return the user config given on the command line, else the default
+
+    Parameters
+    ----------
+    config : typing.Tuple[str]
+        optional user config path given as a command argument
+    cwd : str
+        current working directory within the FAIR repository
+
+    Returns
+    -------
+    str
+        path of the user config file to use
+    """
+    if config:
+        return config[0]
+    import fair.common as fdp_com
+    return fdp_com.local_user_config(cwd)
+
+
+# Options shared between several commands are constructed once
+_DEBUG_OPTION = click.option(
+    "--debug/--no-debug", help="Run in debug mode", default=False
+)
+_LOCAL_OPTION = click.option(
+    "--local/--no-local",
+    help="init without a remote registry - useful for closed systems",
+    default=False,
+)
+_DIRTY_OPTION = click.option(
+    "--dirty/--clean",
+    help="Allow running with uncommitted changes",
+    default=False,
+)
+_REMOTE_OPTION = click.option(
+    "--remote", help="Show Remote Code Runs", default="origin"
+)
+
+
 @click.group()
 @click.version_option(package_name="fair-cli")
-@click.pass_context
-def cli(ctx):
+def cli():
     """Welcome to FAIR-CLI, the FAIR data pipeline command-line interface."""
     pass
 
 @cli.command()
 @click.argument("file_path")
-@click.option("--remote", help="Show Remote Code Runs", default= "origin")
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
-@click.option(
-    "--local/--no-local",
-    help="init without a remote registry - useful for closed systems",
-    default=False,
-)
+@_REMOTE_OPTION
+@_DEBUG_OPTION
+@_LOCAL_OPTION
+@_handle_fair_exceptions
 def identify(file_path: str, remote:str, debug, local:bool) -> None:
     """
     list details of a file
     
     Usage: fair identify /path/to/file [remote]
     """
-    try:
-        with fdp_session.FAIR(
-            os.getcwd(), debug=debug, server_mode=fdp_svr.SwitchMode.CLI, local=local
-        ) as fair_session:
-            fair_session.get_details(file_path, remote = "")
-            if not local:
-                fair_session.get_details(file_path, remote = remote)
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
+    import fair.registry.server as fdp_svr
+    import fair.session as fdp_session
+    with fdp_session.FAIR(
+        os.getcwd(), debug=debug, server_mode=fdp_svr.SwitchMode.CLI, local=local
+    ) as fair_session:
+        fair_session.get_details(file_path, remote = "")
+        if not local:
+            fair_session.get_details(file_path, remote = remote)
 
 @cli.command()
 @click.argument("data_product")
-@click.option("--remote", help="Show Remote Code Runs", default= "origin")
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
-@click.option(
-    "--local/--no-local",
-    help="init without a remote registry - useful for closed systems",
-    default=False,
-)
+@_REMOTE_OPTION
+@_DEBUG_OPTION
+@_LOCAL_OPTION
+@_handle_fair_exceptions
 def find(data_product: str, remote: str, debug:bool, local:bool) -> None:
     """
     Shows where a data product is located
@@ -137,107 +236,103 @@ def find(data_product: str, remote: str, debug:bool, local:bool) -> None:
 
     Usage: fair find data_product [remote]
     """
-    try:
-        with fdp_session.FAIR(
-            os.getcwd(), debug=debug, server_mode=fdp_svr.SwitchMode.CLI, local=local
-        ) as fair_session:
-            fair_session.find_data_product(data_product, "")
-            if not local:
-                fair_session.find_data_product(data_product, remote)
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
+    import fair.registry.server as fdp_svr
+    import fair.session as fdp_session
+    with fdp_session.FAIR(
+        os.getcwd(), debug=debug, server_mode=fdp_svr.SwitchMode.CLI, local=local
+    ) as fair_session:
+        fair_session.find_data_product(data_product, "")
+        if not local:
+            fair_session.find_data_product(data_product, remote)
 
 @cli.command()
 @click.option("--verbose/--not-verbose", help="Display URLs", default=False)
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
+@_DEBUG_OPTION
+@_handle_fair_exceptions
 def status(verbose, debug) -> None:
     """Get the status of files under staging"""
-    try:
-        with fdp_session.FAIR(
-            os.getcwd(), debug=debug, server_mode=fdp_svr.SwitchMode.CLI
-        ) as fair_session:
-            fair_session.status_data_products()
-            fair_session.status_code_runs()
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
-
-@cli.group(invoke_without_command=True)
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
+    import fair.registry.server as fdp_svr
+    import fair.session as fdp_session
+    with fdp_session.FAIR(
+        os.getcwd(), debug=debug, server_mode=fdp_svr.SwitchMode.CLI
+    ) as fair_session:
+        fair_session.status_data_products()
+        fair_session.status_code_runs()
+
+@cli.group(name="list", invoke_without_command=True)
+@_DEBUG_OPTION
 @click.option("--remote", help="Show Remote Code Runs", default= "")
 @click.pass_context
-def list(ctx, debug, remote) -> None:
+@_handle_fair_exceptions
+def list_objects(ctx, debug, remote) -> None:
     """Commands to list data_product(s) and code_run(s)"""
     if ctx.obj is None:
         ctx.obj = {}
     ctx.obj['DEBUG'] = debug
     ctx.obj['REMOTE'] = remote
-    _current_args = " ".join(sys.argv)
-    if not ("data-products" in _current_args or "code-runs" in _current_args):
-        ctx.invoke(data_products)
-        ctx.invoke(code_runs)
-
-@list.command()
-@click.pass_context
-def data_products(ctx) -> None:
-    debug = ctx.obj['DEBUG']
-    remote = ctx.obj['REMOTE']
-    try:
+    if not ctx.invoked_subcommand:
+        import fair.registry.server as fdp_svr
+        import fair.session as fdp_session
+        # Listing both object types shares one session rather than
+        # starting and stopping the registry once per listing
         with fdp_session.FAIR(
             os.getcwd(), debug=debug, server_mode=fdp_svr.SwitchMode.CLI
         ) as fair_session:
             fair_session.show_all_data_products(remote = remote)
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
+            fair_session.show_all_code_runs(remote = remote)
 
-@list.command()
-@click.pass_context
-def code_runs(ctx) -> None:
-    debug = ctx.obj['DEBUG']
-    remote = ctx.obj['REMOTE']
-    try:
+def _make_list_command(name: str, show_method: str, help: str) -> click.Command:
+    """Build a 'list' subcommand displaying objects via a FAIR session method"""
+    @click.pass_context
+    @_handle_fair_exceptions
+    def _list_objects(ctx) -> None:
+        import fair.registry.server as fdp_svr
+        import fair.session as fdp_session
         with fdp_session.FAIR(
-            os.getcwd(), debug=debug, server_mode=fdp_svr.SwitchMode.CLI
+            os.getcwd(), debug=ctx.obj['DEBUG'], server_mode=fdp_svr.SwitchMode.CLI
         ) as fair_session:
-            fair_session.show_all_code_runs(remote = remote)
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
+            getattr(fair_session, show_method)(remote = ctx.obj['REMOTE'])
+
+    return click.command(name=name, help=help)(_list_objects)
+
+
+list_objects.add_command(
+    _make_list_command("data-products", "show_all_data_products", "List data products")
+)
+list_objects.add_command(
+    _make_list_command("code-runs", "show_all_code_runs", "List code runs")
+)
+
 
 @cli.command()
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
+@_DEBUG_OPTION
 @click.argument("output", nargs=-1)
 def create(debug, output: str) -> None:
     """Generate a new FAIR repository user YAML config file"""
+    import fair.common as fdp_com
+    import fair.session as fdp_session
+    _cwd = os.getcwd()
     output = (
         output[0]
         if output
-        else os.path.join(os.getcwd(), fdp_com.USER_CONFIG_FILE)
+        else os.path.join(_cwd, fdp_com.USER_CONFIG_FILE)
     )
     click.echo(f"Generating new user configuration file '{output}'")
-    with fdp_session.FAIR(os.getcwd(), debug=debug) as fair_session:
+    with fdp_session.FAIR(_cwd, debug=debug) as fair_session:
         fair_session.make_starter_config(output)
 
 
 @cli.command()
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
+@_DEBUG_OPTION
+@_handle_fair_exceptions
 def reset(debug: bool) -> None:
     """Unstage all items marked for staging"""
-    try:
-        with fdp_session.FAIR(
-            os.getcwd(), debug=debug, server_mode=fdp_svr.SwitchMode.CLI
-        ) as fair_session:
-            fair_session.reset_staging()
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
+    import fair.registry.server as fdp_svr
+    import fair.session as fdp_session
+    with fdp_session.FAIR(
+        os.getcwd(), debug=debug, server_mode=fdp_svr.SwitchMode.CLI
+    ) as fair_session:
+        fair_session.reset_staging()
 
 
 @cli.command()
@@ -256,22 +351,19 @@ def reset(debug: bool) -> None:
     "--registry",
     help="Specify registry directory",
     default=None,
-    show_default=True,
+    show_default="$FAIR_REGISTRY_DIR or ~/.fair/registry",
 )
 @click.option(
     "--ci/--standard",
     help="Run in testing mode for a CI system",
     default=False,
 )
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
+@_DEBUG_OPTION
 @click.option(
     "--export", help="Export the CLI configuration to a file", default=""
 )
-@click.option(
-    "--local/--no-local",
-    help="init without a remote registry - useful for closed systems",
-    default=False,
-)
+@_LOCAL_OPTION
+@_handle_fair_exceptions
 def init(
     config: str,
     debug: bool,
@@ -282,31 +374,56 @@ def init(
     export: str = "",
 ) -> None:
     """Initialise repository in current location"""
+    import fair.common as fdp_com
+    import fair.exceptions as fdp_exc
+    import fair.session as fdp_session
+    with fdp_session.FAIR(
+        os.getcwd(), None, debug=debug, testing=ci, local=local
+    ) as fair_session:
+        _use_dict = {}
+        if using:
+            try:
+                _use_dict = fdp_com.read_yaml(using)
+            except FileNotFoundError as e:
+                raise fdp_exc.FileNotFoundError(
+                    f"Cannot load CLI configuration from file '{using}', "
+                    "file does not exist."
+                ) from e
+            except OSError as e:
+                raise fdp_exc.CLIConfigurationError(
+                    f"Cannot load CLI configuration from file '{using}': "
+                    f"{e.strerror}"
+                ) from e
+
+        fair_session.initialise(
+            using=_use_dict,
+            registry=registry,
+            export_as=export,
+            local=local,
+        )
+        if config:
+            fair_session.make_starter_config(config)
+
+def _confirm_purge(message: str) -> bool:
+    """Ask the user to confirm a purge step
+
+    When no answer can be read, e.g. a non-interactive run without '--yes',
+    a FAIR-CLI error is raised in place of Click's bare abort. An interrupt
+    from the user is left to Click's own abort handling.
+    """
     try:
-        with fdp_session.FAIR(
-            os.getcwd(), None, debug=debug, testing=ci, local=local
-        ) as fair_session:
-            _use_dict = {}
-            if using:
-                if not os.path.exists(using):
-                    raise fdp_exc.FileNotFoundError(
-                        f"Cannot load CLI configuration from file '{using}', "
-                        "file does not exist."
-                    )
-                _use_dict = yaml.safe_load(open(using, encoding='utf-8'))
-
-            fair_session.initialise(
-                using=_use_dict,
-                registry=registry,
-                export_as=export,
-                local=local,
-            )
-            if config:
-                fair_session.make_starter_config(config)
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
+        return click.confirm(message)
+    except click.Abort as e:
+        # Click raises the same Abort for Ctrl-C and end of input, only the
+        # chained exception tells them apart
+        if not isinstance(e.__context__, EOFError):
+            raise
+        import fair.exceptions as fdp_exc
+        raise fdp_exc.FAIRCLIException(
+            "Purge aborted, no confirmation was given",
+            hint="Use 'fair purge --yes' to purge without prompting",
+        ) from e
+
 
 @cli.command()
 @click.option(
@@ -330,37 +447,36 @@ def init(
     help="Remove all FAIR interfaces and registry",
     default=False,
 )
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
+@_DEBUG_OPTION
+@_handle_fair_exceptions
 def purge(glob: bool, debug: bool, yes: bool, data: bool, all: bool) -> None:
     # sourcery skip: avoid-builtin-shadow
     """Resets the repository deleting all local caches"""
-    _purge = yes
-
+    # Confirmation prompts are skipped entirely when '--yes' is given
     if all:
-        all = click.confirm(
+        all = yes or _confirm_purge(
             "Are you sure you want to remove all FAIR components from this system?\n"
             "WARNING: This will also remove your local registry"
         )
+        # Declining must not fall through to a local purge
+        if not all:
+            return
     else:
-        _purge = click.confirm(
+        if not yes and not _confirm_purge(
             "Are you sure you want to reset FAIR tracking, "
             "this is not reversible?"
-        )
-        if data:
-            data = click.confirm(
+        ):
+            return
+        if data and not yes:
+            data = _confirm_purge(
                 "Are you sure you want to delete the local data directory?\n"
                 "WARNING: Do not do this if you have a populated local registry"
             )
-        if not _purge:
-            return
 
-    try:
-        with fdp_session.FAIR(os.getcwd()) as fair_session:
-            fair_session.purge(global_cfg=glob, clear_data=data, clear_all=all)
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
+    # Only load the session machinery once the purge has been confirmed
+    import fair.session as fdp_session
+    with fdp_session.FAIR(os.getcwd()) as fair_session:
+        fair_session.purge(global_cfg=glob, clear_data=data, clear_all=all)
 
 
 @cli.group()
@@ -370,154 +486,145 @@ def registry() -> None:
 
 
 @registry.command()
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
-def uninstall(debug: bool):
+@click.option(
+    "--yes/--no",
+    help="Uninstall the registry without prompt",
+    default=False,
+)
+@_DEBUG_OPTION
+@_handle_fair_exceptions
+def uninstall(yes: bool, debug: bool):
     """Uninstall the local registry from the system"""
-    _confirm = click.confirm(
+    if not yes and not click.confirm(
         "Are you sure you want to remove the local registry and its components?",
         default=False,
-    )
-    if not _confirm:
+    ):
         return
-    try:
-        if debug:
-            logging.getLogger("FAIRDataPipeline").setLevel(logging.DEBUG)
-        fdp_svr.uninstall_registry()
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
+    import fair.registry.server as fdp_svr
+    if debug:
+        logging.getLogger("FAIRDataPipeline").setLevel(logging.DEBUG)
+    fdp_svr.uninstall_registry()
 
 
 @registry.command()
 @click.option("--force/--no-force", help="Force a reinstall", default=False)
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
+@_DEBUG_OPTION
 @click.option("--directory", help="Installation location", default=None)
 @click.option(
     "--version",
     help="Specify version tag of registry to install, else latest repo tag",
     default=None,
 )
+@_handle_fair_exceptions
 def install(debug: bool, force: bool, directory: str, version: str):
     """Install the local registry on the system"""
-    try:
-        if debug:
-            logging.getLogger("FAIRDataPipeline").setLevel(logging.DEBUG)
-        _version = fdp_svr.install_registry(
-            install_dir=directory, reference=version, force=force
-        )
-        click.echo(f"Installed registry version '{_version}'")
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
+    import fair.registry.server as fdp_svr
+    if debug:
+        logging.getLogger("FAIRDataPipeline").setLevel(logging.DEBUG)
+    _version = fdp_svr.install_registry(
+        install_dir=directory, reference=version, force=force
+    )
+    click.echo(f"Installed registry version '{_version}'")
 
 
 @registry.command()
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
+@_DEBUG_OPTION
 @click.option("--port", help="port on which to run registry", default=8000)
 @click.option("--address", help="Address on which to run registry", default="127.0.0.1")
+@_handle_fair_exceptions
 def start(debug: bool, port: int, address: str) -> None:
     """Start the local registry server"""
-    try:
-        fdp_session.FAIR(
-            os.getcwd(),
-            server_mode=fdp_svr.SwitchMode.USER_START,
-            debug=debug,
-            server_port=port,
-            server_address=address
-        )
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
+    import fair.registry.server as fdp_svr
+    import fair.session as fdp_session
+    fdp_session.FAIR(
+        os.getcwd(),
+        server_mode=fdp_svr.SwitchMode.USER_START,
+        debug=debug,
+        server_port=port,
+        server_address=address
+    )
 
 
 @registry.command()
 @click.option("--force/--no-force", help="Force server stop", default=False)
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
+@_DEBUG_OPTION
+@_handle_fair_exceptions
 def stop(force: bool, debug: bool) -> None:
     """Stop the local registry server"""
+    import fair.registry.server as fdp_svr
+    import fair.session as fdp_session
     _mode = (
         fdp_svr.SwitchMode.FORCE_STOP
         if force
         else fdp_svr.SwitchMode.USER_STOP
     )
-    try:
-        fdp_session.FAIR(os.getcwd(), server_mode=_mode, debug=debug)
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
-
-
-@registry.command()
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
-def status(debug) -> None:
-    try:
-        with fdp_session.FAIR(
-            os.getcwd(), debug=debug, server_mode=fdp_svr.SwitchMode.NO_SERVER
-        ) as fair_session:
-            fair_session.registry_status()
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
+    fdp_session.FAIR(os.getcwd(), server_mode=_mode, debug=debug)
+
+
+@registry.command(name="status")
+@_DEBUG_OPTION
+@_handle_fair_exceptions
+def registry_status(debug) -> None:
+    """Report whether the local registry server is running"""
+    # Only the global configuration is needed, so no session is opened
+    if debug:
+        logging.getLogger("FAIRDataPipeline").setLevel(logging.DEBUG)
+    import fair.configuration as fdp_conf
+    import fair.registry.server as fdp_svr
+    _local_uri = fdp_conf.get_local_uri()
+    if fdp_svr.check_server_running(_local_uri):
+        click.echo(f"Server running at: {_local_uri}")
+    else:
+        click.echo("Server is not running")
 
 
 @cli.command()
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
+@_DEBUG_OPTION
+@_handle_fair_exceptions
 def log(debug: bool) -> None:
     """Show a full job history"""
-    try:
-        fdp_hist.show_history(os.getcwd())
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
+    import fair.history as fdp_hist
+    fdp_hist.show_history(os.getcwd())
 
 
 @cli.command()
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
+@_DEBUG_OPTION
 @click.argument("job_id", shell_complete=complete_jobs)
+@_handle_fair_exceptions
 def view(job_id: str, debug: bool) -> None:
     """View log for a given job"""
-    try:
-        fdp_hist.show_job_log(os.getcwd(), job_id)
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
+    import fair.history as fdp_hist
+    fdp_hist.show_job_log(os.getcwd(), job_id)
 
 
 @cli.command()
-@click.argument("identifier")
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
+@click.argument("identifiers", nargs=-1, required=True)
+@_DEBUG_OPTION
 @click.option("-j", "--job/--no-job", help="Stage entire job", default=False)
-def unstage(identifier: str, debug: bool, job: bool) -> None:
+@_handle_fair_exceptions
+def unstage(identifiers: typing.Tuple[str], debug: bool, job: bool) -> None:
     """Remove data products or jobs from staging"""
-    try:
-        with fdp_session.FAIR(
-            os.getcwd(),
-            debug=debug,
-        ) as fair_session:
-            fair_session.change_staging_state(
-                identifier,
-                job,
-                stage=False,
-            )
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
+    import fair.session as fdp_session
+    with fdp_session.FAIR(
+        os.getcwd(),
+        debug=debug,
+    ) as fair_session:
+        fair_session.change_staging_states(
+            identifiers,
+            job,
+            stage=False,
+        )
 
 
 @cli.command()
-@click.argument("identifier", shell_complete=complete_data_products)
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
-def add(identifier: str, debug: bool) -> None:
+@click.argument(
+    "identifiers", nargs=-1, required=True, shell_complete=complete_data_products
+)
+@_DEBUG_OPTION
+@_handle_fair_exceptions
+def add(identifiers: typing.Tuple[str], debug: bool) -> None:
     """
-    Add a data product or coderun to staging
+    Add data products or coderuns to staging
 
     Data Products should be formatted: 
     <namespace>:<data product name>@v<version>
@@ -528,24 +635,21 @@ def add(identifier: str, debug: bool) -> None:
 
     Use `fair list` to view Data Products and Code Runs
     
+    Multiple identifiers can be given, these are staged within a single
+    session.
     """
-    try:
-        with fdp_session.FAIR(
-            os.getcwd(),
-            debug=debug,
-        ) as fair_session:
-            fair_session.add_to_staging(
-                identifier
-            )
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
+    import fair.session as fdp_session
+    with fdp_session.FAIR(
+        os.getcwd(),
+        debug=debug,
+    ) as fair_session:
+        fair_session.add_to_staging_many(identifiers)
 
 
-@cli.command()
+# Not yet implemented, hidden from the command listing until it is
+@cli.command(hidden=True)
 @click.argument("job_ids", nargs=-1)
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
+@_DEBUG_OPTION
 @click.option(
     "--cached/--not-cached",
     default=False,
@@ -565,69 +669,59 @@ def rm(
     help="Specify a shell command to execute, this will be inserted into the working config",
     default="",
 )
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
+@_DEBUG_OPTION
 @click.option(
     "--ci/--no-ci",
     help="Calls run passively without executing any commands for a CI system",
     default=False,
 )
-@click.option(
-    "--dirty/--clean",
-    help="Allow running with uncommitted changes",
-    default=False,
-)
-@click.option(
-    "--local/--no-local",
-    help="init without a remote registry - useful for closed systems",
-    default=False,
-)
+@_DIRTY_OPTION
+@_LOCAL_OPTION
+@_handle_fair_exceptions
 def run(
     config: str, script: str, debug: bool, ci: bool, dirty: bool, local: bool
 ):
     """Initialises a job with the option to specify a bash command"""
+    import fair.registry.server as fdp_svr
+    import fair.run as fdp_run
+    import fair.session as fdp_session
     # Allow no config to be specified, if that is the case use default local
     click.echo("Running run please wait")
-    config = config[0] if config else fdp_com.local_user_config(os.getcwd())
-    try:
-        with fdp_session.FAIR(
-            os.getcwd(),
-            config,
-            debug=debug,
-            server_mode=fdp_svr.SwitchMode.CLI,
-            allow_dirty=dirty,
-            local=local,
-        ) as fair_session:
-            _hash = fair_session.run(
-                script, passive=ci, allow_dirty=dirty, local=local
-            )
-            if ci:
-                click.echo(fdp_run.get_job_dir(_hash))
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
+    _cwd = os.getcwd()
+    config = _user_config_path(config, _cwd)
+    with fdp_session.FAIR(
+        _cwd,
+        config,
+        debug=debug,
+        server_mode=fdp_svr.SwitchMode.CLI,
+        allow_dirty=dirty,
+        local=local,
+    ) as fair_session:
+        _hash = fair_session.run(
+            script, passive=ci, allow_dirty=dirty, local=local
+        )
+        if ci:
+            click.echo(fdp_run.get_job_dir(_hash))
 
 
 @cli.group(invoke_without_command=True)
 @click.option("--verbose/--no-verbose", "-v/")
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
+@_DEBUG_OPTION
 @click.pass_context
+@_handle_fair_exceptions
 def remote(ctx, verbose: bool = False, debug: bool = False):
     """List remotes if no additional command is provided"""
+    import fair.session as fdp_session
     if not ctx.invoked_subcommand:
-        try:
-            with fdp_session.FAIR(os.getcwd(), debug=debug) as fair_session:
-                fair_session.list_remotes(verbose)
-        except fdp_exc.FAIRCLIException as e:
-            e.err_print()
-            if e.level.lower() == "error":
-                sys.exit(e.exit_code)
+        with fdp_session.FAIR(os.getcwd(), debug=debug) as fair_session:
+            fair_session.list_remotes(verbose)
 
 
-@remote.command()
+@remote.command(name="add")
 @click.argument("options", nargs=-1)
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
-def add(options: typing.List[str], debug: bool) -> None:
+@_DEBUG_OPTION
+@_handle_fair_exceptions
+def remote_add(options: typing.List[str], debug: bool) -> None:
     """Add a remote registry URL with option to give it a label if multiple
     remotes may be used.
 
@@ -638,21 +732,26 @@ def add(options: typing.List[str], debug: bool) -> None:
             - label, url
             - url
     """
-    _url = options[1] if len(options) > 1 else options[0]
-    _label = options[0] if len(options) > 1 else "origin"
+    if not options or len(options) > 2:
+        raise click.BadArgumentUsage(
+            "Expected either a URL or a label followed by a URL"
+        )
 
-    try:
-        with fdp_session.FAIR(os.getcwd(), debug=debug) as fair_session:
-            fair_session.add_remote(_url, _label)
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
+    import fair.session as fdp_session
+
+    if len(options) == 2:
+        _label, _url = options
+    else:
+        _label, _url = "origin", options[0]
+
+    with fdp_session.FAIR(os.getcwd(), debug=debug) as fair_session:
+        fair_session.add_remote(_url, _label)
 
 
 @remote.command()
 @click.argument("label")
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
+@_DEBUG_OPTION
+@_handle_fair_exceptions
 def remove(label: str, debug: bool) -> None:
     """Removes the specified remote from the remotes list
 
@@ -661,102 +760,103 @@ def remove(label: str, debug: bool) -> None:
     label : str
         label of remote to remove
     """
-    try:
-        with fdp_session.FAIR(os.getcwd(), debug=debug) as fair_session:
-            fair_session.remove_remove(label)
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
+    import fair.session as fdp_session
+    with fdp_session.FAIR(os.getcwd(), debug=debug) as fair_session:
+        fair_session.remove_remove(label)
 
 
 @remote.command()
 @click.argument("label")
 @click.argument("url")
 @click.pass_context
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
+@_DEBUG_OPTION
+@_handle_fair_exceptions
 def modify(ctx, label: str, url: str, debug: bool) -> None:
     """Modify a remote address"""
-    try:
-        with fdp_session.FAIR(os.getcwd(), debug=debug) as fair_session:
-            fair_session.modify_remote(label, url)
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
+    import fair.session as fdp_session
+    with fdp_session.FAIR(os.getcwd(), debug=debug) as fair_session:
+        fair_session.modify_remote(label, url)
 
 
 @cli.command()
 @click.argument("remote", nargs=-1)
-@click.option("--debug/--no-debug", help="Run in debug mode", default=False)
-@click.option(
-    "--dirty/--clean",
-    help="Allow running with uncommitted changes",
-    default=False,
-)
+@_DEBUG_OPTION
+@_DIRTY_OPTION
+@_handle_fair_exceptions
 def push(remote: str, debug: bool, dirty: bool):
     """Push data between the local and remote registry"""
+    import fair.registry.server as fdp_svr
+    import fair.session as fdp_session
     click.echo("Running push please wait")
     remote = remote[0] if remote else "origin"
-    try:
-        with fdp_session.FAIR(
-            os.getcwd(),
-            debug=debug,
-            server_mode=fdp_svr.SwitchMode.CLI,
-            allow_dirty=dirty,
-        ) as fair_session:
-            fair_session.push(remote)
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
+    with fdp_session.FAIR(
+        os.getcwd(),
+        debug=debug,
+        server_mode=fdp_svr.SwitchMode.CLI,
+        allow_dirty=dirty,
+    ) as fair_session:
+        fair_session.push(remote)
 
 
-@cli.group()
+@cli.group(chain=True)
 def config():
-    """Configure user information"""
+    """Configure user information
+
+    Several settings can be given in one call, e.g.
+    'fair config user.name "Joe Bloggs" user.email jbloggs@email.com',
+    and are written to the configuration together.
+    """
     pass
 
 
+@config.result_callback()
+def apply_config(settings: typing.List[typing.Tuple[str, str]]) -> None:
+    """Write the user settings collected from the chained config commands
+
+    Parameters
+    ----------
+    settings : typing.List[typing.Tuple[str, str]]
+        (field, value) pairs returned by each 'user.*' subcommand, applied
+        to the local configuration in a single update
+    """
+    import fair.configuration as fdp_conf
+    fdp_conf.update_user(os.getcwd(), **dict(settings))
+
+
 @config.command(name="user.name")
 @click.argument("user_name")
-def config_user(user_name: str) -> None:
-    fdp_conf.set_user(os.getcwd(), user_name)
+def config_user(user_name: str) -> typing.Tuple[str, str]:
+    return "name", user_name
 
 
 @config.command(name="user.email")
 @click.argument("user_email")
-def config_email(user_email: str) -> None:
-    fdp_conf.set_email(os.getcwd(), user_email)
+def config_email(user_email: str) -> typing.Tuple[str, str]:
+    return "email", user_email
 
 
 @cli.command()
 @click.argument("config", nargs=-1)
-@click.option("--debug/--no-debug")
-@click.option(
-    "--local/--no-local",
-    help="init without a remote registry - useful for closed systems",
-    default=False,
-)
+@_DEBUG_OPTION
+@_LOCAL_OPTION
+@_handle_fair_exceptions
 def pull(config: str, debug: bool, local: bool):
     """Update local registry from remotes and sources"""
+    import fair.registry.server as fdp_svr
+    import fair.session as fdp_session
     click.echo("Running pull please wait")
-    config = config[0] if config else fdp_com.local_user_config(os.getcwd())
-    try:
-        with fdp_session.FAIR(
-            os.getcwd(),
-            config,
-            server_mode=fdp_svr.SwitchMode.CLI,
-            debug=debug,
-            local=local,
-            allow_dirty=True,
-        ) as fair:
-            fair.pull()
-    except fdp_exc.FAIRCLIException as e:
-        e.err_print()
-        if e.level.lower() == "error":
-            sys.exit(e.exit_code)
-
-
-if __name__ in "__main__":
+    _cwd = os.getcwd()
+    config = _user_config_path(config, _cwd)
+    with fdp_session.FAIR(
+        _cwd,
+        config,
+        server_mode=fdp_svr.SwitchMode.CLI,
+        debug=debug,
+        local=local,
+        allow_dirty=True,
+    ) as fair:
+        fair.pull()
+
+
+if __name__ == "__main__":
     cli(obj={})
@@ -14,14 +14,17 @@ Contents
 
 Members
 -------
+    USER_HOME_DIR   - user home directory
     USER_FAIR_DIR   - user FAIR directory
     FAIR_CLI_CONFIG - name of the FAIR-CLI configuration file
     FAIR_FOLDER     - name for FAIR local repository directory
+    STAGING_JSON_SUFFIX - suffix of the JSON copy of the staging file
 
 Functions
 -------
     registry_home       - returns the location of the local data registry
     find_fair_root      - returns the closest '.fair' directory in the upper hierarchy
+    clear_fair_root_cache - forgets repository roots located by find_fair_root
     find_git_root       - returns the closest '.git' directory
     staging_cache       - returns the current repository staging cache directory
     default_data_dir    - returns the default data store
@@ -31,15 +34,19 @@ Functions
     global_config_dir   - returns the FAIR-CLI global config directory
     global_fdpconfig    - returns path of FAIR-CLI global config
     session_cache_dir   - returns location of session cache folder
+    read_yaml           - parses a YAML file using the fastest available loader
+    write_file          - atomically writes bytes to a file
+    write_yaml          - atomically writes a mapping to a YAML file
 
 """
 __date__ = "2021-06-28"
 
 import enum
 import os
-import pathlib
 import logging
 import stat
+import tempfile
+import typing
 
 import git
 import yaml
@@ -48,10 +55,13 @@ import fair.exceptions as fdp_exc
 
 _logger = logging.getLogger("FAIRDataPipeline.Common")
 
-USER_FAIR_DIR = os.path.join(pathlib.Path.home(), ".fair")
+USER_HOME_DIR = os.path.expanduser("~")
+USER_FAIR_DIR = os.path.join(USER_HOME_DIR, ".fair")
 FAIR_CLI_CONFIG = "cli-config.yaml"
 USER_CONFIG_FILE = "config.yaml"
 FAIR_FOLDER = ".fair"
+# Suffix of the JSON copy of the staging file kept for fast reading
+STAGING_JSON_SUFFIX = ".json"
 JOBS_DIR = "jobs"
 
 FAIR_REGISTRY_REPO = "https://github.com/FAIRDataPipeline/data-registry.git"
@@ -59,12 +69,19 @@ FAIR_REGISTRY_REPO = "https://github.com/FAIRDataPipeline/data-registry.git"
 DEFAULT_REGISTRY_DOMAIN = "https://data.fairdatapipeline.org/"
 REGISTRY_INSTALL_URL = "https://data.fairdatapipeline.org/static/localregistry.sh"
 
-DEFAULT_REGISTRY_LOCATION = os.path.join(
-    pathlib.Path().home(), FAIR_FOLDER, "registry"
-)
+DEFAULT_REGISTRY_LOCATION = os.path.join(USER_FAIR_DIR, "registry")
 
 DEFAULT_LOCAL_REGISTRY_URL = "http://127.0.0.1:8000/api/"
 
+# Use the LibYAML bindings where PyYAML was built with them, these parse and
+# emit considerably faster than the pure Python implementation
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+# Repository roots already located, keyed by the absolute search start
+_FAIR_ROOT_CACHE: typing.Dict[str, str] = {}
+
 
 class CMD_MODE(enum.Enum):
     RUN = 1
@@ -74,12 +91,13 @@ class CMD_MODE(enum.Enum):
 
 
 def registry_home() -> str:
-    if not os.path.exists(global_fdpconfig()):
+    try:
+        _glob_conf = read_yaml(global_fdpconfig())
+    except FileNotFoundError:
         if "FAIR_REGISTRY_DIR" in os.environ:
             return os.environ["FAIR_REGISTRY_DIR"]
         else:
             return DEFAULT_REGISTRY_LOCATION
-    _glob_conf = yaml.safe_load(open(global_fdpconfig(), encoding='utf-8'))
     if not _glob_conf:
         return DEFAULT_REGISTRY_LOCATION
     if "registries" not in _glob_conf:
@@ -100,37 +118,65 @@ def registry_home() -> str:
     return _glob_conf["registries"]["local"]["directory"]
 
 
-def find_fair_root(start_directory: str = os.getcwd()) -> str:
+def find_fair_root(start_directory: str = None) -> str:
     """Locate the .fair folder within the current hierarchy
 
     Parameters
     ----------
 
     start_directory : str, optional
-        starting point for local FAIR folder search
+        starting point for local FAIR folder search, by default the
+        current working directory
 
     Returns
     -------
     str
         absolute path of the .fair folder
     """
-    _current_dir = os.path.abspath(start_directory)
+    _start_dir = os.path.abspath(start_directory or os.getcwd())
+
+    # A previously located root only needs confirming it still exists rather
+    # than walking the hierarchy again
+    _cached_root = _FAIR_ROOT_CACHE.get(_start_dir)
+
+    if _cached_root and os.path.isdir(os.path.join(_cached_root, FAIR_FOLDER)):
+        return _cached_root
+
+    _current_dir = _start_dir
 
     while _current_dir:
         # If the home directory has been reached then abort as upper file system
         # is outside user area, also we do not want to return global FAIR folder
-        if str(_current_dir) == str(pathlib.Path().home()):
+        if _current_dir == USER_HOME_DIR:
             return ""
 
-        if os.path.exists(os.path.join(_current_dir, FAIR_FOLDER)):
-            return _current_dir
-        _current_dir, _directory = os.path.split(_current_dir)
+        # A single stat both confirms the folder exists and that it is
+        # a directory, most levels will not have one so expect failure
+        try:
+            if stat.S_ISDIR(os.stat(os.path.join(_current_dir, FAIR_FOLDER)).st_mode):
+                _FAIR_ROOT_CACHE[_start_dir] = _current_dir
+                return _current_dir
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+
+        _parent_dir = os.path.dirname(_current_dir)
 
-        # If there is no directory component this means the top of the file
+        # If the parent is the directory itself the top of the file
         # system has been reached
-        if not _directory:
+        if _parent_dir == _current_dir:
             return ""
 
+        _current_dir = _parent_dir
+
+
+def clear_fair_root_cache() -> None:
+    """Forget all previously located FAIR repository roots
+
+    Must be called when a FAIR folder is created, as a new repository may be
+    nested within one which has already been located.
+    """
+    _FAIR_ROOT_CACHE.clear()
+
 
 def registry_session_port_file(registry_dir: str = None) -> str:
     """Retrieve the location of the registry session port file
@@ -201,12 +247,16 @@ def registry_session_address(registry_dir: str = None) -> str:
     str
         current/most recent address used to launch the registry
     """
-    if not os.path.exists(registry_session_address_file(registry_dir)):
+    try:
+        with open(
+            registry_session_address_file(registry_dir), encoding='utf-8'
+        ) as in_f:
+            _address = in_f.read().strip()
+    except FileNotFoundError:
         _logger.warning("Session Address file not found, please make sure your registry is up-to-date")
         _logger.info("Using 127.0.0.1")
         return "127.0.0.1"
 
-    _address = open(registry_session_address_file(registry_dir), encoding='utf-8').read().strip()
     if _address != "0.0.0.0":
         return _address
     else:
@@ -222,11 +272,12 @@ def staging_cache(user_loc: str) -> str:
 
 def default_data_dir(location: str = "local") -> str:
     """Location of the default data store"""
-    if not os.path.exists(global_fdpconfig()):
+    try:
+        _glob_conf = read_yaml(global_fdpconfig())
+    except FileNotFoundError as e:
         raise fdp_exc.InternalError(
             f"Failed to read CLI global config file '{global_fdpconfig()}'"
-        )
-    _glob_conf = yaml.safe_load(open(global_fdpconfig(), encoding='utf-8'))
+        ) from e
     if "data_store" in _glob_conf["registries"][location]:
         return _glob_conf["registries"][location]["data_store"]
     if location == "local":
@@ -237,12 +288,12 @@ def default_data_dir(location: str = "local") -> str:
         )
 
 
-def local_fdpconfig(user_loc: str = os.getcwd()) -> str:
+def local_fdpconfig(user_loc: str = None) -> str:
     """Location of the FAIR-CLI configuration file for the given repository"""
     return os.path.join(find_fair_root(user_loc), FAIR_FOLDER, FAIR_CLI_CONFIG)
 
 
-def local_user_config(user_loc: str = os.getcwd()) -> str:
+def local_user_config(user_loc: str = None) -> str:
     """Location of the default user configuration file for the given repository"""
     return os.path.join(find_fair_root(user_loc), USER_CONFIG_FILE)
 
@@ -267,20 +318,23 @@ def global_fdpconfig() -> str:
     return os.path.join(global_config_dir(), FAIR_CLI_CONFIG)
 
 
-def find_git_root(start_directory: str = os.getcwd()) -> str:
+def find_git_root(start_directory: str = None) -> str:
     """Locate the .git folder within the current hierarchy
 
     Parameters
     ----------
 
     start_directory : str, optional
-        starting point for local git folder search
+        starting point for local git folder search, by default the
+        current working directory
 
     Returns
     -------
     str
         absolute path of the .git folder
     """
+    start_directory = start_directory or os.getcwd()
+
     try:
         _repository = git.Repo(start_directory, search_parent_directories=True)
     except git.InvalidGitRepositoryError as e:
@@ -291,6 +345,91 @@ def find_git_root(start_directory: str = os.getcwd()) -> str:
 
     return _repository.git.rev_parse("--show-toplevel").strip()
 
+def read_yaml(file_name: str) -> typing.Any:
+    """Parse a YAML file using the fastest available safe loader
+
+    Parameters
+    ----------
+    file_name : str
+        path of the YAML file to read
+
+    Returns
+    -------
+    typing.Any
+        parsed contents of the file
+    """
+    with open(file_name, mode="rb") as in_f:
+        return yaml.load(in_f.read(), Loader=YAML_LOADER)
+
+
+def write_file(file_name: str, contents: bytes) -> None:
+    """Atomically write contents to a file
+
+    The data are written to a temporary file in the same directory which then
+    replaces the target, so readers never see a partially written file. A
+    symlinked target is resolved so the file it points to is updated, and the
+    permissions of an existing file are kept.
+
+    Parameters
+    ----------
+    file_name : str
+        path of the file to write
+    contents : bytes
+        data to write
+    """
+    _target = os.path.realpath(file_name)
+
+    # Keep the permissions of an existing file, else those a plain open gives
+    try:
+        _mode = stat.S_IMODE(os.stat(_target).st_mode)
+    except FileNotFoundError:
+        _mode = 0o666 & ~_current_umask()
+
+    _fd, _tmp_file = tempfile.mkstemp(
+        dir=os.path.dirname(_target),
+        prefix=f".{os.path.basename(_target)}.",
+        suffix=".tmp",
+    )
+    _replaced = False
+    try:
+        with os.fdopen(_fd, mode="wb") as out_f:
+            if hasattr(os, "fchmod"):
+                os.fchmod(out_f.fileno(), _mode)
+            out_f.write(contents)
+            # The data must be on disk before the rename makes them visible
+            out_f.flush()
+            os.fsync(out_f.fileno())
+        if not hasattr(os, "fchmod"):
+            os.chmod(_tmp_file, _mode)
+        os.replace(_tmp_file, _target)
+        _replaced = True
+    finally:
+        if not _replaced and os.path.exists(_tmp_file):
+            os.remove(_tmp_file)
+
+
+def _current_umask() -> int:
+    """Read the process umask, which can only be done by setting it"""
+    _umask = os.umask(0)
+    os.umask(_umask)
+    return _umask
+
+
+def write_yaml(file_name: str, contents: typing.Any, **kwargs) -> None:
+    """Atomically write contents to a YAML file
+
+    Parameters
+    ----------
+    file_name : str
+        path of the YAML file to write
+    contents : typing.Any
+        data to serialise
+    **kwargs
+        additional arguments passed to yaml.dump
+    """
+    write_file(file_name, yaml.dump(contents, encoding="utf-8", **kwargs))
+
+
 def set_file_permissions(path: str):
     for root, dirs, files in os.walk(path, topdown=False):
         for dir in [os.path.join(root,d) for d in dirs]:
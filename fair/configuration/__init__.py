@@ -17,6 +17,7 @@ Functions
     read_global_fdpconfig - read the contents of the global CLI config file
     set_email - set the user's email in the configuration
     set_user - set the user's name in the configuration
+    update_user - set the user's name and email in a single write
     get_current_user_name - retrieve name of the current user
     get_current_user_email - retrieve email of the current user
     get_remote_uri - retrieve URL for the remote registry
@@ -54,7 +55,6 @@ from urllib.parse import urljoin, urlparse
 
 import click
 import git
-import yaml
 
 import fair.common as fdp_com
 import fair.exceptions as fdp_exc
@@ -82,8 +82,10 @@ def read_local_fdpconfig(repo_loc: str) -> typing.MutableMapping:
 
     # Retrieve the location of this repositories CLI config file
     _local_config_file_addr = fdp_com.local_fdpconfig(repo_loc)
-    if os.path.exists(_local_config_file_addr):
-        _local_config = yaml.safe_load(open(_local_config_file_addr, encoding='utf-8'))
+    try:
+        _local_config = fdp_com.read_yaml(_local_config_file_addr)
+    except FileNotFoundError:
+        pass
 
     return _local_config
 
@@ -101,12 +103,68 @@ def read_global_fdpconfig() -> typing.MutableMapping:
     # Retrieve the location of the global CLI config file
     _global_config_addr = fdp_com.global_fdpconfig()
 
-    if os.path.exists(_global_config_addr):
-        _global_config = yaml.safe_load(open(_global_config_addr, encoding='utf-8'))
+    try:
+        _global_config = fdp_com.read_yaml(_global_config_addr)
+    except FileNotFoundError:
+        pass
 
     return _global_config
 
 
+def _split_user_name(name: str) -> typing.Tuple[str, typing.Optional[str]]:
+    """Split a full name into given names and family name"""
+    if len(name.split()) > 1:
+        _given_name, _family_name = name.rsplit(" ", 1)
+        return _given_name.title().strip(), _family_name.title().strip()
+    return name.title().strip(), None
+
+
+def update_user(
+    repo_loc: str,
+    name: str = None,
+    email: str = None,
+    is_global: bool = False,
+) -> None:
+    """Update the name and/or email of the user in a single write
+
+    Parameters
+    ----------
+    repo_loc : str
+        repository directory path
+    name : str, optional
+        new user full name, by default None (unchanged)
+    email : str, optional
+        new email address to set, by default None (unchanged)
+    is_global : bool, optional
+        whether to also override the global settings, by default False
+    """
+    _user_fields: typing.Dict[str, typing.Optional[str]] = {}
+    if name is not None:
+        _given_name, _family_name = _split_user_name(name)
+        _user_fields["given_names"] = _given_name
+        _user_fields["family_name"] = _family_name
+    if email is not None:
+        _user_fields["email"] = email
+
+    if not _user_fields:
+        return
+
+    _loc_conf = read_local_fdpconfig(repo_loc)
+    _loc_conf["user"].update(_user_fields)
+    fdp_com.write_yaml(fdp_com.local_fdpconfig(repo_loc), _loc_conf)
+
+    # Read and write the global configuration only once for all fields
+    if is_global:
+        if name is not None:
+            # Keep the global full name in step with its title-cased parts
+            _user_fields["name"] = " ".join(
+                _part for _part in (_given_name, _family_name) if _part
+            )
+        _glob_conf = read_global_fdpconfig()
+        _glob_conf["user"].update(_user_fields)
+        fdp_com.write_yaml(fdp_com.global_fdpconfig(), _glob_conf)
+
+
 def set_email(repo_loc: str, email: str, is_global: bool = False) -> None:
     """Update the email address for the user
 
@@ -119,13 +177,7 @@ def set_email(repo_loc: str, email: str, is_global: bool = False) -> None:
     is_global : bool, optional
         whether to also override the global settings, by default False
     """
-    _loc_conf = read_local_fdpconfig(repo_loc)
-    _loc_conf["user"]["email"] = email
-    yaml.dump(_loc_conf, open(fdp_com.local_fdpconfig(repo_loc), encoding='utf-8', mode= "w"))
-    if is_global:
-        _glob_conf = read_global_fdpconfig()
-        _glob_conf["user"]["email"] = email
-        yaml.dump(_glob_conf, open(fdp_com.global_fdpconfig(), encoding='utf-8', mode= "w"))
+    update_user(repo_loc, email=email, is_global=is_global)
 
 
 def set_user(repo_loc: str, name: str, is_global: bool = False) -> None:
@@ -140,29 +192,7 @@ def set_user(repo_loc: str, name: str, is_global: bool = False) -> None:
     is_global : bool, optional
         whether to also override the global settings, by default False
     """
-    _loc_conf = read_local_fdpconfig(repo_loc)
-    if len(name.split()) > 1:
-        _given_name, _family_name = name.rsplit(" ", 1)
-        _loc_conf["user"]["given_names"] = _given_name.title().strip()
-        _loc_conf["user"]["family_name"] = _family_name.title().strip()
-        if is_global:
-            _glob_conf = read_global_fdpconfig()
-            _glob_conf["user"]["given_names"] = _given_name.title().strip()
-            _glob_conf["user"]["family_name"] = _family_name.title().strip()
-            yaml.dump(_glob_conf, open(fdp_com.global_fdpconfig(), encoding='utf-8', mode= "w"))
-    else:
-        _loc_conf["user"]["given_names"] = name.title().strip()
-        _loc_conf["user"]["family_name"] = None
-        if is_global:
-            _glob_conf = read_global_fdpconfig()
-            _glob_conf["user"]["given_names"] = name.title().strip()
-            _glob_conf["user"]["family_name"] = None
-            yaml.dump(_glob_conf, open(fdp_com.global_fdpconfig(), encoding='utf-8', mode= "w"))
-    yaml.dump(_loc_conf, open(fdp_com.local_fdpconfig(repo_loc), encoding='utf-8', mode= "w"))
-    if is_global:
-        _glob_conf = read_global_fdpconfig()
-        _glob_conf["user"]["name"] = name
-        yaml.dump(_glob_conf, open(fdp_com.global_fdpconfig(), encoding='utf-8', mode= "w"))
+    update_user(repo_loc, name=name, is_global=is_global)
 
 
 def get_current_user_name(repo_loc: str) -> typing.Tuple[str]:
@@ -437,8 +467,7 @@ def set_local_uri(uri: str) -> str:
 
     _global_conf["registries"]["local"]["uri"] = uri
 
-    with open(fdp_com.global_fdpconfig(), encoding='utf-8', mode= "w") as out_f:
-        yaml.dump(_global_conf, out_f)
+    fdp_com.write_yaml(fdp_com.global_fdpconfig(), _global_conf)
 
 
 def get_local_port(local_uri: str = None) -> int:
@@ -460,11 +489,10 @@ def update_local_port(registry_dir: str = None) -> str:
 
     _new_url = f'http://{_current_address}:{_current_port}/api/'
 
-    if os.path.exists(fdp_com.global_fdpconfig()) and read_global_fdpconfig():
-        _glob_conf = read_global_fdpconfig()
+    _glob_conf = read_global_fdpconfig()
+    if _glob_conf:
         _glob_conf["registries"]["local"]["uri"] = _new_url
-        with open(fdp_com.global_fdpconfig(), encoding='utf-8', mode= "w") as out_f:
-            yaml.dump(_glob_conf, out_f)
+        fdp_com.write_yaml(fdp_com.global_fdpconfig(), _glob_conf)
 
     return _new_url
 
@@ -607,9 +635,10 @@ def _handle_uuid() -> typing.Tuple[typing.Dict, str]:
     _full_name = click.prompt("Full Name")
     _def_ospace = ""
     _user_info = {}
-    if len(_full_name.split()) > 1:
-        _given_name, _family_name = _full_name.split(" ", 1)
-        _def_ospace = _full_name.lower().replace(" ", "")
+    _name_parts = _full_name.split(maxsplit=1)
+    if len(_name_parts) > 1:
+        _given_name, _family_name = _name_parts
+        _def_ospace = "".join(_full_name.lower().split())
         _user_info["given_names"] = _given_name.strip()
         _user_info["family_name"] = _family_name.strip()
     else:
@@ -674,7 +703,7 @@ def _get_user_info_and_namespaces(local: bool = False, remote_url: str = None) -
         else:
             click.echo("Type a valid ID system: GITHUB/ORCID/ROR/GRID/None")
 
-    _def_ospace = _def_ospace.lower().replace(" ", "").strip()
+    _def_ospace = "".join(_def_ospace.lower().split())
     _def_ospace = click.prompt("Default output namespace", default=_def_ospace)
     _def_ispace = click.prompt("Default input namespace", default=_def_ospace)
 
@@ -832,7 +861,7 @@ def global_config_query(
 
 
 def local_config_query(
-    global_config: typing.Dict[str, typing.Any] = read_global_fdpconfig(),
+    global_config: typing.Dict[str, typing.Any] = None,
     first_time_setup: bool = False,
     local: bool = False,
 ) -> typing.Dict[str, typing.Any]:
@@ -841,7 +870,8 @@ def local_config_query(
     Parameters
     ----------
     global_config : Dict[str, Any], optional
-        global configuration dictionary
+        global configuration dictionary, by default read from the global
+        configuration file
     first_time_setup : bool, optional
         if first time need to setup globals as well, by default False
 
@@ -850,6 +880,9 @@ def local_config_query(
     Dict[str, Any]
         dictionary of local configurations
     """
+    if global_config is None:
+        global_config = read_global_fdpconfig()
+
     # Try extracting global configurations. If any keys do not exist re-run
     # setup for creation of these, then try again.
     try:
@@ -16,18 +16,14 @@ Functions
 
     history_directory - returns the current repository logs directory
 """
-import glob
 import os
+import typing
 
 import click
-import rich
-
-from pathlib import Path
 
 import fair.common as fdp_com
 import fair.exceptions as fdp_exc
 import fair.run as fdp_run
-import fair.templates as fdp_tpl
 
 
 def history_directory(repo_loc: str) -> str:
@@ -48,6 +44,29 @@ def history_directory(repo_loc: str) -> str:
     )
 
 
+def _sorted_job_dirs() -> typing.List[str]:
+    """List the job directories, most recent first
+
+    Returns
+    -------
+    typing.List[str]
+        paths of job directories sorted in reverse timestamp order
+    """
+    # Directory entries from scandir carry the file type from the directory
+    # listing itself so no separate stat is needed to filter them
+    try:
+        with os.scandir(fdp_com.default_jobs_dir()) as entries:
+            _job_dirs = [
+                entry.path
+                for entry in entries
+                if not entry.name.startswith(".") and entry.is_dir()
+            ]
+    except FileNotFoundError:
+        return []
+
+    return sorted(_job_dirs, reverse=True)
+
+
 def show_job_log(repo_loc: str, job_id: str) -> str:
     """Show the log from a given job
 
@@ -63,11 +82,7 @@ def show_job_log(repo_loc: str, job_id: str) -> str:
     str
         log file location for the given job
     """
-    _job_dir  = Path(f"{fdp_com.default_jobs_dir()}")
-
-    _sorted_time_dirs = sorted(
-        glob.glob(os.path.join(_job_dir, "*")), reverse=True
-    )
+    _sorted_time_dirs = _sorted_job_dirs()
 
     _log_files = [
         os.path.join(
@@ -111,11 +126,13 @@ def show_history(repo_loc: str, length: int = 10) -> None:
         max number of entries to display, by default 10
     """
 
-    _job_dir  = Path(f"{fdp_com.default_jobs_dir()}")
+    # Rendering the history is the only use of rich and the Jinja templates
+    # within this module, import them here to keep other commands fast
+    import rich
 
-    _sorted_time_dirs = sorted(
-        glob.glob(os.path.join(_job_dir, "*")), reverse=True
-    )
+    import fair.templates as fdp_tpl
+
+    _sorted_time_dirs = _sorted_job_dirs()
 
     _log_files = [
         os.path.join(
@@ -133,14 +150,18 @@ def show_history(repo_loc: str, length: int = 10) -> None:
             raise fdp_exc.FileNotFoundError(
                 f"Cannot open log for job '{_job_id}'"
             )
+        # The metadata header is at the top of the log, iterate over the file
+        # lazily and stop at the rule closing the header so that the job
+        # output which follows it is never read
+        _metadata = []
         with open(_log_file, encoding='utf-8') as f:
-            _log_lines = f.readlines()
-            _metadata = []
-            for line in _log_lines:
+            for line in f:
                 if "------- time taken " in line:
                     break
                 if " = " in line:
                     _metadata.append(line)
+                elif _metadata and line.startswith("-----"):
+                    break
         if not _metadata:
             continue
         _metadata = [i for i in _metadata if i.strip()]
@@ -26,12 +26,12 @@ class JobLogger:
         time_stamp: datetime.datetime,
         output_dir: str,
         command: str,
-        project_dir: str = os.getcwd(),
+        project_dir: str = None,
     ) -> None:
         self._log: typing.List[str] = []
         self._directory = output_dir
         self._command = command
-        self._project = project_dir
+        self._project = project_dir or os.getcwd()
         self._now = time_stamp
         self._file_stream = None
 
@@ -66,6 +66,10 @@ class SwitchMode(enum.Enum):
     NO_SERVER = 4
 
 
+# Modes which request the server be stopped
+STOP_MODES = frozenset({SwitchMode.USER_STOP, SwitchMode.FORCE_STOP})
+
+
 def check_server_running(local_uri: str = None) -> bool:
     """Check the state of server
 
@@ -86,14 +90,33 @@ def check_server_running(local_uri: str = None) -> bool:
 
     logger.debug("Checking if server is running on '%s'", local_uri)
 
+    # Only the status is needed so the response body is never downloaded
     try:
-        _status_code = requests.get(local_uri).status_code
-        assert _status_code == 200
-        return True
-    except (requests.exceptions.ConnectionError, AssertionError):
+        with requests.get(local_uri, stream=True) as _response:
+            return _response.status_code == 200
+    except requests.exceptions.ConnectionError:
         return False
 
 
+def _stream_output(process: subprocess.Popen, chunk_size: int = 64 * 1024) -> None:
+    """Forward the output of a process to stdout as it arrives
+
+    Reads whatever is currently available on the pipe, up to 'chunk_size'
+    bytes, in one system call rather than a byte at a time.
+
+    Parameters
+    ----------
+    process : subprocess.Popen
+        process launched with stdout set to subprocess.PIPE
+    chunk_size : int, optional
+        maximum number of bytes to read per call, by default 64KiB
+    """
+    _out_fd = process.stdout.fileno()
+    for chunk in iter(lambda: os.read(_out_fd, chunk_size), b""):
+        sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
+
+
 def launch_server(
     port: int = 8000, registry_dir: str = None, verbose: bool = False, address: str = "127.0.0.1"
 ) -> int:
@@ -136,8 +159,7 @@ def launch_server(
     )
 
     if verbose and platform.system() != "Windows":
-        for c in iter(lambda: _start.stdout.read(1), b""):
-            sys.stdout.buffer.write(c)
+        _stream_output(_start)
 
     _start.wait()
 
@@ -203,8 +225,7 @@ def stop_server(
     )
 
     if verbose:
-        for c in iter(lambda: _stop.stdout.read(1), b""):
-            sys.stdout.buffer.write(c)
+        _stream_output(_stop)
 
     _stop.wait()
 
@@ -27,8 +27,7 @@ import logging
 import os
 import typing
 
-import yaml
-
+import fair.common as fdp_com
 import fair.configuration as fdp_conf
 import fair.exceptions as fdp_exc
 import fair.identifiers as fdp_id
@@ -226,7 +225,7 @@ def store_working_config(
 
     _root_store = get_write_storage(uri, work_cfg_yml, token)
 
-    _work_cfg = yaml.safe_load(open(work_cfg_yml, encoding='utf-8'))
+    _work_cfg = fdp_com.read_yaml(work_cfg_yml)
     _work_cfg_data_store = _work_cfg["run_metadata"]["write_data_store"]
     _rel_path = os.path.relpath(work_cfg_yml, _work_cfg_data_store)
     _time_stamp_dir = os.path.basename(os.path.dirname(work_cfg_yml))
@@ -305,7 +304,7 @@ def store_working_script(
     """
     logger.debug("Storing working script on registry")
 
-    _work_cfg = yaml.safe_load(open(working_config, encoding='utf-8'))
+    _work_cfg = fdp_com.read_yaml(working_config)
     _root_store = get_write_storage(uri, working_config, token)
     _data_store = _work_cfg["run_metadata"]["write_data_store"]
 
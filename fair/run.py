@@ -12,7 +12,6 @@ retrieved metadata
 
 __date__ = "2021-06-30"
 
-import glob
 import hashlib
 import logging
 import os
@@ -45,6 +44,11 @@ SHELLS: typing.Dict[str, str] = {
 }
 
 
+def _hash_job_path(job_dir: str) -> str:
+    """Compute the hash identifying the job in the given directory"""
+    return hashlib.sha1(os.path.abspath(job_dir).encode("utf-8")).hexdigest()
+
+
 def get_job_hash(job_dir: str) -> str:
     """Retrieve the hash for a given job
 
@@ -67,8 +71,29 @@ def get_job_hash(job_dir: str) -> str:
             "Failed to find hash for job, "
             f"directory '{job_dir}' does not exist."
         )
-    _directory = os.path.abspath(job_dir)
-    return hashlib.sha1(_directory.encode("utf-8")).hexdigest()
+    return _hash_job_path(job_dir)
+
+
+def get_job_hashes() -> typing.Dict[str, str]:
+    """Map the hashes of all jobs to their directories
+
+    The jobs directory is listed once and hashes are computed from the
+    listing, without checking each job directory individually.
+
+    Returns
+    -------
+    Dict[str, str]
+        job directories keyed by job hash
+    """
+    try:
+        _entries = os.scandir(fdp_com.default_jobs_dir())
+    except FileNotFoundError:
+        return {}
+
+    with _entries:
+        _jobs = [e.path for e in _entries if not e.name.startswith(".")]
+
+    return {_hash_job_path(job): job for job in _jobs}
 
 
 def get_job_dir(job_hash: str) -> str:
@@ -84,11 +109,4 @@ def get_job_dir(job_hash: str) -> str:
     str
         associated job directory
     """
-    _jobs = glob.glob(os.path.join(fdp_com.default_jobs_dir(), "*"))
-
-    for job in _jobs:
-        _hash = hashlib.sha1(os.path.abspath(job).encode("utf-8")).hexdigest()
-        if _hash == job_hash:
-            return job
-
-    return ""
+    return get_job_hashes().get(job_hash, "")
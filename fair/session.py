@@ -33,7 +33,6 @@ import copy
 import glob
 import logging
 import os
-import pathlib
 import re
 import shutil
 import typing
@@ -58,7 +57,6 @@ import fair.registry.requests as fdp_req
 import fair.registry.server as fdp_serv
 import fair.registry.sync as fdp_sync
 import fair.staging as fdp_stage
-import fair.templates as fdp_tpl
 import fair.testing as fdp_test
 import fair.user_config as fdp_user
 import fair.logging as fdp_logging
@@ -125,6 +123,7 @@ class FAIR:
         self._testing = testing
         self._local = local
         self._session_loc = repo_loc
+        self._fair_root: str = ""
         self._allow_dirty = allow_dirty
         self._logger.debug(f"Session location: {self._session_loc}")
         self._run_mode = server_mode
@@ -151,12 +150,11 @@ class FAIR:
                 "mean the local registry has not been installed."
             )
 
-        if not os.path.exists(fdp_com.global_config_dir()):
-            self._logger.debug(
-                "Creating directory: %s", fdp_com.global_config_dir()
-            )
-            os.makedirs(fdp_com.global_config_dir())
-            assert os.path.exists(fdp_com.global_config_dir())
+        _global_config_dir = fdp_com.global_config_dir()
+        self._logger.debug(
+            "Ensuring directory exists: %s", _global_config_dir
+        )
+        os.makedirs(_global_config_dir, exist_ok=True)
 
         # Initialise all configuration status dictionaries
         self._local_config: typing.Dict[str, typing.Any] = {}
@@ -204,9 +202,9 @@ class FAIR:
         clear_all : bool, optional
             remove all FAIR components from the system, overrides others, default is False
         """
-        _root_dir = os.path.join(
-            fdp_com.find_fair_root(self._session_loc), fdp_com.FAIR_FOLDER
-        )
+        _root_dir = os.path.join(self._get_fair_root(), fdp_com.FAIR_FOLDER)
+        self._fair_root = ""
+        fdp_com.clear_fair_root_cache()
         if os.path.exists(_root_dir):
             if verbose:
                 click.echo(f"Removing directory '{_root_dir}'")
@@ -230,14 +228,15 @@ class FAIR:
             return
         if clear_data:
             try:
-                if verbose and os.path.exists(fdp_com.default_data_dir()):
-                    click.echo(
-                        f"Removing directory '{fdp_com.default_data_dir()}'"
-                    )
-                if os.path.exists(fdp_com.default_data_dir()):
+                # Locating the data store requires parsing the global
+                # configuration so only do this once
+                _data_dir = fdp_com.default_data_dir()
+                if os.path.exists(_data_dir):
+                    if verbose:
+                        click.echo(f"Removing directory '{_data_dir}'")
                     if platform.system() == "Windows":
-                        fdp_com.set_file_permissions(fdp_com.default_data_dir())
-                    shutil.rmtree(fdp_com.default_data_dir(), onerror=fdp_com.remove_readonly)
+                        fdp_com.set_file_permissions(_data_dir)
+                    shutil.rmtree(_data_dir, onerror=fdp_com.remove_readonly)
             except FileNotFoundError as e:
                 raise fdp_exc.FileNotFoundError(
                     "Cannot remove local data store, a global CLI configuration "
@@ -264,10 +263,7 @@ class FAIR:
             self._setup_server_cli_mode(port, address)
         elif self._run_mode == fdp_serv.SwitchMode.USER_START:
             self._setup_server_user_start(port, address)
-        elif self._run_mode in [
-            fdp_serv.SwitchMode.USER_STOP,
-            fdp_serv.SwitchMode.FORCE_STOP,
-        ]:
+        elif self._run_mode in fdp_serv.STOP_MODES:
             self._stop_server()
 
     def _stop_server(self) -> None:
@@ -279,17 +275,13 @@ class FAIR:
         if os.path.exists(_cache_addr):
             os.remove(_cache_addr)
         click.echo("Stopping local registry server.")
-        if (
-            os.listdir(fdp_com.session_cache_dir())
-            and self._run_mode != fdp_serv.SwitchMode.FORCE_STOP
-        ):
+        _force = self._run_mode == fdp_serv.SwitchMode.FORCE_STOP
+        if not _force and os.listdir(fdp_com.session_cache_dir()):
             raise fdp_exc.UnexpectedRegistryServerState(
                 "Cannot stop registry, a process may still be running",
                 hint="You can force stop using '--force'",
             )
-        fdp_serv.stop_server(
-            force=self._run_mode == fdp_serv.SwitchMode.FORCE_STOP,
-        )
+        fdp_serv.stop_server(force=_force)
 
     def _setup_server_cli_mode(self, port: int, address: str) -> None:
         self.check_is_repo()
@@ -312,11 +304,11 @@ class FAIR:
             )
 
         # Create new session cache file
-        pathlib.Path(_cache_addr).touch()
+        with open(_cache_addr, mode="a"):
+            pass
 
     def _setup_server_user_start(self, port: int, address: str) -> None:
-        if not os.path.exists(fdp_com.session_cache_dir()):
-            os.makedirs(fdp_com.session_cache_dir())
+        os.makedirs(fdp_com.session_cache_dir(), exist_ok=True)
 
         _cache_addr = os.path.join(fdp_com.session_cache_dir(), "user.run")
 
@@ -331,15 +323,14 @@ class FAIR:
                 "Server already running."
             )
         click.echo("Starting local registry server")
-        pathlib.Path(_cache_addr).touch()
+        with open(_cache_addr, mode="a"):
+            pass
         fdp_serv.launch_server(port=port, verbose=True, address=address)
 
     def _pre_job_setup(self, remote: str = None) -> None:
         self._logger.debug("Running pre-job setup")
         self.check_is_repo()
-        self._session_config.update_from_fair(
-            fdp_com.find_fair_root(self._session_loc), remote
-        )
+        self._session_config.update_from_fair(self._get_fair_root(), remote)
 
     def _post_job_breakdown(self, add_run: bool = False) -> None:
         if add_run:
@@ -358,8 +349,9 @@ class FAIR:
         self._session_config.close_log()
 
     def registry_status(self):
-        if fdp_serv.check_server_running():
-            click.echo(f'Server running at: {fdp_conf.get_local_uri()}')
+        _local_uri = fdp_conf.get_local_uri()
+        if fdp_serv.check_server_running(_local_uri):
+            click.echo(f'Server running at: {_local_uri}')
         else:
             click.echo('Server is not running')
 
@@ -438,14 +430,12 @@ class FAIR:
         self._post_job_breakdown()
 
         # When push successful unstage data products again
-        for code_run in _staged_code_runs:
-            self._stager.change_stage_status(
-                code_run, "code_run", False
-            )
-        for data_product in _staged_data_products:
-            self._stager.change_stage_status(
-                data_product, "data_product", False
-            )
+        self._stager.change_stage_status_many(
+            _staged_code_runs, "code_run", False
+        )
+        self._stager.change_stage_status_many(
+            _staged_data_products, "data_product", False
+        )
 
     def pull(self, remote: str = "origin"):
         if not self._local:
@@ -562,11 +552,24 @@ class FAIR:
 
         return self._session_config.hash
 
+    def _get_fair_root(self) -> str:
+        """Retrieve the FAIR repository root for the session location
+
+        The root is only searched for until it has been found, subsequent
+        calls return the stored result.
+        """
+        if not self._fair_root:
+            self._fair_root = fdp_com.find_fair_root(self._session_loc)
+        return self._fair_root
+
     def check_is_repo(self, location: str = None) -> None:
         """Check that the current location is a FAIR repository"""
-        if not location:
+        if not location or location == self._session_loc:
             location = self._session_loc
-        if not fdp_com.find_fair_root(location):
+            _fair_root = self._get_fair_root()
+        else:
+            _fair_root = fdp_com.find_fair_root(location)
+        if not _fair_root:
             raise fdp_exc.FDPRepositoryError(
                 f"'{location}' is not a FAIR repository",
                 hint="Run 'fair init' to initialise.",
@@ -653,12 +656,20 @@ class FAIR:
         """
         self._logger.debug("Loading CLI configurations.")
 
-        if os.path.exists(fdp_com.global_fdpconfig()):
-            self._global_config = fdp_conf.read_global_fdpconfig()
-        if os.path.exists(fdp_com.local_fdpconfig(self._session_loc)):
-            self._local_config = fdp_conf.read_local_fdpconfig(
-                self._session_loc
-            )
+        # Missing configuration files are read as empty configurations
+        self._global_config = fdp_conf.read_global_fdpconfig()
+        self._local_config = fdp_conf.read_local_fdpconfig(self._session_loc)
+
+        self._record_saved_configurations()
+
+    def _record_saved_configurations(self) -> None:
+        """Keep a copy of the configurations as they are on disk
+
+        This allows the session to skip rewriting configurations on close
+        when they have not been modified.
+        """
+        self._saved_global_config = copy.deepcopy(self._global_config)
+        self._saved_local_config = copy.deepcopy(self._local_config)
 
     def reset_staging(self) -> None:
         """Reset all staged items"""
@@ -686,6 +697,41 @@ class FAIR:
         else:
             self._stager.change_stage_status(identifier, type_to_stage, stage)
 
+    def change_staging_states(
+        self,
+        identifiers: typing.List[str],
+        job: bool = False,
+        stage: bool = True,
+    ) -> None:
+        """Change the staging status of several items at once
+
+        Items other than jobs are grouped by type so the staging file is
+        only updated once per type.
+
+        Parameters
+        ----------
+        identifiers : typing.List[str]
+            identifiers of the items to update
+        job : bool, optional
+            whether the identifiers are jobs, by default False
+        stage : bool, optional
+            whether to stage/unstage items, by default True (staged)
+        """
+        self.check_is_repo()
+
+        _by_type: typing.Dict[str, typing.List[str]] = {}
+
+        for identifier in identifiers:
+            _by_type.setdefault(
+                self.get_type_to_stage(identifier, job), []
+            ).append(identifier)
+
+        for job_id in _by_type.pop("job", []):
+            self._stager.change_job_stage_status(job_id, stage)
+
+        for type_to_stage, items in _by_type.items():
+            self._stager.change_stage_status_many(items, type_to_stage, stage)
+
     def get_type_to_stage(self, identifier, job: bool = False) ->str:
         if ":" in identifier and "@" in identifier:
             return "data_product"
@@ -695,17 +741,42 @@ class FAIR:
             return "code_run"
 
     def add_to_staging(self, identifier):
-        item_type = self.get_type_to_stage(identifier)
-        if self._stager.is_in_staging_dict(identifier, item_type):
-            self.change_staging_state(identifier)
-        elif self.is_staging_item_in_registry(identifier, item_type):
-            self._stager.add_to_staging(identifier, item_type)
-            self.change_staging_state(identifier)
-        else:
-            raise fdp_exc.StagingError(
-                f"Cannot stage '{item_type}' with label '{identifier}', "
-                "item does not exist in staging or local registry."
-            )
+        self.add_to_staging_many([identifier])
+
+    def add_to_staging_many(self, identifiers: typing.List[str]) -> None:
+        """Stage several items, tracking any which are not yet tracked
+
+        Every identifier is checked before any change is made, the staging
+        file is then updated at most twice per item type.
+
+        Parameters
+        ----------
+        identifiers : typing.List[str]
+            identifiers of the items to stage
+        """
+        self.check_is_repo()
+
+        _tracked: typing.Dict[str, typing.List[str]] = {}
+        _untracked: typing.Dict[str, typing.List[str]] = {}
+
+        for identifier in identifiers:
+            item_type = self.get_type_to_stage(identifier)
+            if self._stager.is_in_staging_dict(identifier, item_type):
+                _tracked.setdefault(item_type, []).append(identifier)
+            elif self.is_staging_item_in_registry(identifier, item_type):
+                _untracked.setdefault(item_type, []).append(identifier)
+            else:
+                raise fdp_exc.StagingError(
+                    f"Cannot stage '{item_type}' with label '{identifier}', "
+                    "item does not exist in staging or local registry."
+                )
+
+        for item_type, items in _tracked.items():
+            self._stager.change_stage_status_many(items, item_type, True)
+
+        # Track and stage the new items with a single staging file update
+        for item_type, items in _untracked.items():
+            self._stager.add_to_staging_many(items, item_type, stage=True)
 
     def is_staging_item_in_registry(self, identifier, item_type) -> bool:
         local_uri = fdp_conf.get_local_uri()        
@@ -817,12 +888,10 @@ class FAIR:
         self.check_is_repo()
 
         self._stager.update_data_product_staging()
-        _staged_data_products = self._stager.get_item_list(
-            True, "data_product"
-        )
-        _unstaged_data_products = self._stager.get_item_list(
-            False, "data_product"
-        )
+        (
+            _staged_data_products,
+            _unstaged_data_products,
+        ) = self._stager.get_item_lists("data_product")
 
         if _staged_data_products:
             self.show_data_products(
@@ -837,9 +906,7 @@ class FAIR:
                 style="red",
             )
             click.echo(
-                rich.print(
-                    '(use "fair add <DataProduct>..." to stage DataProducts)'
-                )
+                '(use "fair add <DataProduct>..." to stage DataProducts)'
             )
 
         if not _unstaged_data_products and not _staged_data_products:
@@ -851,12 +918,10 @@ class FAIR:
         self.check_is_repo()
 
         self._stager.update_code_run_staging()
-        _staged_code_runs = self._stager.get_item_list(
-            True, "code_run"
-        )
-        _unstaged_code_runs = self._stager.get_item_list(
-            False, "code_run"
-        )
+        (
+            _staged_code_runs,
+            _unstaged_code_runs,
+        ) = self._stager.get_item_lists("code_run")
 
         if _staged_code_runs:
             self.show_code_runs(
@@ -871,9 +936,7 @@ class FAIR:
                 style="red",
             )
             click.echo(
-                rich.print(
-                    '(use "fair add <code_rub>..." to stage code_run)'
-                )
+                '(use "fair add <code_run>..." to stage code_run)'
             )
 
         if not _unstaged_code_runs and not _staged_code_runs:
@@ -1021,63 +1084,80 @@ class FAIR:
         self._logger.debug("Getting job staging status")
         self.check_is_repo()
 
-        _staged_jobs = self._stager.get_item_list(True, "job")
-        _unstaged_jobs = self._stager.get_item_list(False, "job")
+        _staged_jobs, _unstaged_jobs = self._stager.get_item_lists("job")
 
-        if _staged_jobs:
-            click.echo("Changes to be synchronized:")
-            click.echo("\tJobs:")
-            for job in _staged_jobs:
-                click.echo(click.style(f"\t\t{job}", fg="green"))
-                _job_urls = self._stager.get_job_data(
-                    fdp_conf.get_local_uri(), job
-                )
-                if not verbose:
-                    continue
+        # Job data are only displayed in verbose mode
+        _local_uri = fdp_conf.get_local_uri() if verbose else None
 
-                for key, value in _job_urls.items():
-                    if not value:
-                        continue
-                    click.echo(click.style(f"\t\t\t{key}:", fg="green"))
-                    if isinstance(value, list):
-                        for url in value:
-                            click.echo(
-                                click.style(f"\t\t\t\t{url}", fg="green")
-                            )
-                    else:
-                        click.echo(click.style(f"\t\t\t\t{value}", fg="green"))
+        # Output for each section is assembled first and then written at once
+        if _staged_jobs:
+            _lines = ["Changes to be synchronized:", "\tJobs:"]
+            _lines += self._job_status_lines(_staged_jobs, "green", _local_uri)
+            click.echo("\n".join(_lines))
 
         if _unstaged_jobs:
-            click.echo("Changes not staged for synchronization:")
-            click.echo('\t(use "fair add <job>..." to stage jobs)')
+            _lines = [
+                "Changes not staged for synchronization:",
+                '\t(use "fair add <job>..." to stage jobs)',
+                "\tJobs:",
+            ]
+            _lines += self._job_status_lines(
+                _unstaged_jobs, "red", _local_uri, title_keys=True
+            )
+            click.echo("\n".join(_lines))
+
+        if not _unstaged_jobs and not _staged_jobs:
+            click.echo("No jobs marked for tracking.")
 
-            click.echo("\tJobs:")
+    def _job_status_lines(
+        self,
+        jobs: typing.List[str],
+        colour: str,
+        local_uri: str = None,
+        title_keys: bool = False,
+    ) -> typing.List[str]:
+        """Create the styled status lines for a set of jobs
 
-            for job in _unstaged_jobs:
-                click.echo(click.style(f"\t\t{job}", fg="red"))
-                _job_urls = self._stager.get_job_data(
-                    fdp_conf.get_local_uri(), job
-                )
+        Parameters
+        ----------
+        jobs : typing.List[str]
+            jobs to display
+        colour : str
+            colour of the displayed lines
+        local_uri : str, optional
+            local registry URI, if given the data for each job are also listed
+        title_keys : bool, optional
+            whether to display job data keys in title case, default False
+
+        Returns
+        -------
+        typing.List[str]
+            styled lines for display
+        """
+        _lines: typing.List[str] = []
 
-                if not verbose:
-                    continue
+        for job in jobs:
+            _lines.append(click.style(f"\t\t{job}", fg=colour))
+
+            if not local_uri:
+                continue
+
+            _job_urls = self._stager.get_job_data(local_uri, job)
 
-                for key, value in _job_urls.items():
-                    if not value:
-                        continue
-                    click.echo(
-                        click.style(
-                            f"\t\t\t{key.replace('_', ' ').title()}:", fg="red"
-                        )
+            for key, value in _job_urls.items():
+                if not value:
+                    continue
+                if title_keys:
+                    key = key.replace("_", " ").title()
+                _lines.append(click.style(f"\t\t\t{key}:", fg=colour))
+                if isinstance(value, list):
+                    _lines.extend(
+                        click.style(f"\t\t\t\t{url}", fg=colour) for url in value
                     )
-                    if isinstance(value, list):
-                        for url in value:
-                            click.echo(click.style(f"\t\t\t\t{url}", fg="red"))
-                    else:
-                        click.echo(click.style(f"\t\t\t\t{value}", fg="red"))
+                else:
+                    _lines.append(click.style(f"\t\t\t\t{value}", fg=colour))
 
-        if not _unstaged_jobs and not _staged_jobs:
-            click.echo("No jobs marked for tracking.")
+        return _lines
 
     def make_starter_config(self, output_file_name: str = None) -> None:
         """Create a starter config.yaml"""
@@ -1098,15 +1178,15 @@ class FAIR:
                 " by running: \n\n\tfair remote add <url>\n",
             )
 
+        import fair.templates as fdp_tpl
+
         with open(output_file_name, encoding='utf-8', mode= "w") as f:
             _yaml_str = fdp_tpl.config_template.render(
                 instance=self,
                 data_dir=fdp_com.default_data_dir(),
-                local_repo=os.path.abspath(
-                    fdp_com.find_fair_root(self._session_loc)
-                ),
+                local_repo=os.path.abspath(self._get_fair_root()),
             )
-            _yaml_dict = yaml.safe_load(_yaml_str)
+            _yaml_dict = yaml.load(_yaml_str, Loader=fdp_com.YAML_LOADER)
 
             yaml.dump(_yaml_dict, f, sort_keys=False)
 
@@ -1147,9 +1227,9 @@ class FAIR:
                 shutil.rmtree(_fair_dir, onerror=fdp_com.remove_readonly)
             using = fdp_test.create_configurations(
                 registry,
-                fdp_com.find_git_root(os.getcwd()),
-                os.getcwd(),
-                os.path.join(os.getcwd(), ".fair"),
+                fdp_com.find_git_root(self._session_loc),
+                self._session_loc,
+                _fair_dir,
             )
 
         if os.path.exists(_fair_dir) and not self._testing:
@@ -1175,12 +1255,16 @@ class FAIR:
                 "Initialising FAIR repository, setup will now ask for basic info (leave blank for default value):\n"
             )
 
-        if not os.path.exists(_fair_dir) or self._testing:
-            os.makedirs(_fair_dir, exist_ok=True)
-            os.makedirs(fdp_com.session_cache_dir(), exist_ok=True)
-            if using:
-                self._validate_and_load_cli_config(using)
-            self._stager.initialise()
+        # Any existing FAIR folder has either been removed (testing) or has
+        # already ended initialisation above, so it can be created directly
+        os.makedirs(_fair_dir, exist_ok=True)
+        # Any root found before initialisation is superseded by this one
+        self._fair_root = ""
+        fdp_com.clear_fair_root_cache()
+        os.makedirs(fdp_com.session_cache_dir(), exist_ok=True)
+        if using:
+            self._validate_and_load_cli_config(using)
+        self._stager.initialise()
 
         if not os.path.exists(fdp_com.global_fdpconfig()):
             try:
@@ -1211,10 +1295,10 @@ class FAIR:
             except (fdp_exc.CLIConfigurationError, click.Abort) as e:
                 self._clean_reset(_fair_dir, e, True)
         if not using:
-            with open(fdp_com.local_fdpconfig(self._session_loc), encoding='utf-8', mode= "w") as f:
-                yaml.dump(self._local_config, f)
-            with open(fdp_com.global_fdpconfig(), encoding='utf-8', mode= "w") as f:
-                yaml.dump(self._global_config, f)
+            fdp_com.write_yaml(
+                fdp_com.local_fdpconfig(self._session_loc), self._local_config
+            )
+            fdp_com.write_yaml(fdp_com.global_fdpconfig(), self._global_config)
         else:
             if not self._testing:
                 click.echo("Setup will now ask you questions regarding the global configuration")
@@ -1225,6 +1309,8 @@ class FAIR:
                 self._session_loc
             )
 
+        self._record_saved_configurations()
+
         if export_as:
             self._export_cli_configuration(export_as)
 
@@ -1270,8 +1356,12 @@ class FAIR:
 
     def close_session(self) -> None:
         """Upon exiting, dump all configurations to file"""
-        if not os.path.exists(
-            os.path.join(self._session_loc, fdp_com.FAIR_FOLDER)
+        # The session may have been opened from a subdirectory, so check
+        # the repository root rather than the session location
+        _fair_root = self._get_fair_root()
+
+        if not _fair_root or not os.path.isdir(
+            os.path.join(_fair_root, fdp_com.FAIR_FOLDER)
         ):
             return
 
@@ -1282,12 +1372,19 @@ class FAIR:
             )
             os.remove(_cache_addr)
 
-        if os.path.exists(fdp_com.global_config_dir()):
-            with open(fdp_com.global_fdpconfig(), encoding='utf-8', mode= "w") as f:
-                yaml.dump(self._global_config, f)
-        if os.path.exists(os.path.dirname(fdp_com.local_fdpconfig())):
-            with open(fdp_com.local_fdpconfig(self._session_loc), encoding='utf-8', mode= "w") as f:
-                yaml.dump(self._local_config, f)
+        # Only write back configurations which have been modified
+        if (
+            self._global_config != self._saved_global_config
+            and os.path.exists(fdp_com.global_config_dir())
+        ):
+            fdp_com.write_yaml(fdp_com.global_fdpconfig(), self._global_config)
+        if self._local_config != self._saved_local_config:
+            fdp_com.write_yaml(
+                os.path.join(
+                    _fair_root, fdp_com.FAIR_FOLDER, fdp_com.FAIR_CLI_CONFIG
+                ),
+                self._local_config,
+            )
 
     def _validate_and_load_cli_config(self, cli_config: typing.Dict):
         _exp_keys = ["registries", "namespaces", "user", "git"]
@@ -1368,10 +1465,14 @@ class FAIR:
         _api_url = fdp_conf.get_local_uri() if not remote else fdp_conf.get_remote_uri(self._session_loc, remote)
         _token = fdp_req.local_token() if not remote else fdp_conf.get_remote_token(self._session_loc, remote)
         _registry = f"Local Registry {_api_url}" if not remote else f"Remote Registry {remote} {_api_url}"
-        if not os.path.exists(file_path):
-            raise fdp_exc.FileNotFoundError(f"File: {file_path} does not exist")
+        # Hashing opens the file anyway so use that to check it exists
+        try:
+            _hash = fdp_store.calculate_file_hash(file_path)
+        except (FileNotFoundError, IsADirectoryError) as e:
+            raise fdp_exc.FileNotFoundError(
+                f"File: {file_path} does not exist"
+            ) from e
         click.echo(f"Information about file: {file_path}")
-        _hash = fdp_store.calculate_file_hash(file_path)
         _storage_location = fdp_req.get(_api_url,
                                          "storage_location",
                                          _token,
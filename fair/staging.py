@@ -18,6 +18,8 @@ Classes
 
 __date__ = "2021-07-13"
 
+import copy
+import json
 import logging
 import os
 import typing
@@ -53,30 +55,77 @@ class Stager:
         """
         self._root = repo_root
         self._staging_file = fdp_com.staging_cache(self._root)
+        self._staging_dir = os.path.dirname(self._staging_file)
+        # Parsed staging contents keyed by the file status they were read from
+        self._staging_cache: typing.Optional[
+            typing.Tuple[
+                typing.Tuple[int, int, int],
+                typing.Dict[str, typing.Dict[str, bool]],
+            ]
+        ] = None
         self._logger.debug(
             "Creating stager for FAIR repository '%s'", repo_root
         )
 
     def initialise(self) -> None:
         """Initialise the stager, creating a staging cache file if one does not exist"""
+        # If the stager is called before the rest of the directory tree
+        # has been created make the parent directories first
+        os.makedirs(self._staging_dir, exist_ok=True)
+
         # Only create the staging file if one is not already present within the
-        # specified directory
-        if not os.path.exists(self._staging_file):
-            self._logger.debug("Creating new staging cache file")
-            # If the stager is called before the rest of the directory tree
-            # has been created make the parent directories first
-            if not os.path.exists(os.path.dirname(self._staging_file)):
-                os.makedirs(os.path.dirname(self._staging_file), exist_ok=True)
+        # specified directory, the exclusive open performs the check
+        try:
             self._create_staging_file()
-        else:
+            self._logger.debug("Created new staging cache file")
+        except FileExistsError:
             self._logger.debug("Existing staging cache found")
 
-    def _create_file_label(self, file_to_stage: str) -> str:
-        return os.path.relpath(
-            file_to_stage,
-            os.path.dirname(self._staging_file),
+    def _staging_file_key(self) -> typing.Tuple[int, int, int]:
+        _stat = os.stat(self._staging_file)
+        return (_stat.st_ino, _stat.st_mtime_ns, _stat.st_size)
+
+    def _load_staging(self) -> typing.Dict[str, typing.Dict[str, bool]]:
+        """Parse the staging file, reusing the last result if it is unchanged
+
+        The file is only parsed again if its inode, modification time or size
+        differ from when it was last read or written by this stager. The
+        cached dictionary is returned so it must not be modified.
+        """
+        _key = self._staging_file_key()
+
+        if self._staging_cache is None or self._staging_cache[0] != _key:
+            _staging_dict = fdp_com.read_yaml(self._staging_file)
+            self._staging_cache = (_key, _staging_dict)
+
+        return self._staging_cache[1]
+
+    def _read_staging(self) -> typing.Dict[str, typing.Dict[str, bool]]:
+        """Return a copy of the staging dictionary which callers may modify"""
+        return copy.deepcopy(self._load_staging())
+
+    def _write_staging(
+        self, staging_dict: typing.Dict[str, typing.Dict[str, bool]]
+    ) -> None:
+        """Serialise the staging dictionary and atomically replace the file"""
+        fdp_com.write_yaml(
+            self._staging_file, staging_dict, Dumper=fdp_com.YAML_DUMPER
+        )
+        self._staging_cache = (
+            self._staging_file_key(),
+            copy.deepcopy(staging_dict),
         )
 
+        # Keep a JSON copy alongside for readers such as shell completion
+        # which can parse it faster, it is only a cache so failure is ignored
+        try:
+            fdp_com.write_file(
+                f"{self._staging_file}{fdp_com.STAGING_JSON_SUFFIX}",
+                json.dumps(staging_dict).encode("utf-8"),
+            )
+        except OSError as e:
+            self._logger.debug("Failed to write staging JSON copy: %s", e)
+
     def _create_staging_file(self) -> None:
         _staging_dict = {
             "job": {},
@@ -84,17 +133,31 @@ class Stager:
             "data_product": {},
             "code_run": {},
         }
-        yaml.dump(_staging_dict, open(self._staging_file, encoding='utf-8', mode= "w"))
+        with open(self._staging_file, mode="xb") as out_f:
+            out_f.write(
+                yaml.dump(
+                    _staging_dict, Dumper=fdp_com.YAML_DUMPER, encoding="utf-8"
+                )
+            )
 
     def reset_staged(self) -> None:
         """Change staging state of all items to unstaged"""
-        _staging_dict = yaml.safe_load(open(self._staging_file, encoding='utf-8'))
-        for obj_type in _staging_dict:
-            for item in _staging_dict[obj_type]:
-                _staging_dict[obj_type][item] = False
-        yaml.dump(_staging_dict, open(self._staging_file, "w"))        
+        _staging_dict = self._load_staging()
+
+        # Nothing to write if no items are currently staged
+        if not any(any(items.values()) for items in _staging_dict.values()):
+            return
 
-    def add_to_staging(self, identifier: str, item_type: str) -> None:
+        self._write_staging(
+            {
+                obj_type: dict.fromkeys(items, False)
+                for obj_type, items in _staging_dict.items()
+            }
+        )
+
+    def add_to_staging(
+        self, identifier: str, item_type: str, stage: bool = False
+    ) -> None:
         """Add an item to tracking
 
         Parameters
@@ -103,15 +166,37 @@ class Stager:
             unique identifier for the item
         item_type : str
             the item type
+        stage : bool, optional
+            whether the item is also staged, default False
+        """
+        self.add_to_staging_many([identifier], item_type, stage)
+
+    def add_to_staging_many(
+        self,
+        identifiers: typing.List[str],
+        item_type: str,
+        stage: bool = False,
+    ) -> None:
+        """Add several items of the same type to tracking at once
+
+        Parameters
+        ----------
+        identifiers : typing.List[str]
+            unique identifiers for the items
+        item_type : str
+            the item type
+        stage : bool, optional
+            whether the items are also staged, default False
         """
+        if not identifiers:
+            return
+
         # Open the staging dictionary first
-        with open(self._staging_file, encoding='utf-8') as f:
-            _staging_dict = yaml.safe_load(f)
+        _staging_dict = self._read_staging()
 
-        _staging_dict[item_type][identifier] = False
+        _staging_dict[item_type].update(dict.fromkeys(identifiers, stage))
 
-        with open(self._staging_file, encoding='utf-8', mode= "w") as f:
-            yaml.dump(_staging_dict, f)
+        self._write_staging(_staging_dict)
 
     def change_stage_status(
         self,
@@ -119,32 +204,62 @@ class Stager:
         item_type: str,
         stage: bool = True,
     ) -> None:
+        self.change_stage_status_many([identifier], item_type, stage)
+
+    def change_stage_status_many(
+        self,
+        identifiers: typing.List[str],
+        item_type: str,
+        stage: bool = True,
+    ) -> None:
+        """Set the staging status of several items of the same type at once
+
+        The staging file is read and written only once regardless of the
+        number of identifiers given.
+
+        Parameters
+        ----------
+        identifiers : typing.List[str]
+            unique identifiers for the items
+        item_type : str
+            the item type
+        stage : bool, optional
+            whether items are staged, default True
+        """
+        if not identifiers:
+            return
+
         self._logger.debug(
-            "Setting %s '%s' status to staged=%s", item_type, identifier, stage
+            "Setting %s %s status to staged=%s", item_type, identifiers, stage
         )
 
-        if not os.path.exists(self._staging_file):
+        # Open the staging dictionary first, reading the file is itself the
+        # check that it exists
+        try:
+            _staging_dict = self._read_staging()
+        except FileNotFoundError as e:
             raise fdp_exc.FileNotFoundError(
                 "Failed to update tracking, expected staging file"
                 f" '{self._staging_file}' but it does not exist"
-            )
-      
-        if not self.is_in_staging_dict(identifier, item_type):
-            raise fdp_exc.StagingError(
-                f"Cannot stage '{item_type}' with label '{identifier}', "
-                "item does not exist."
-            )
-        
-        # Open the staging dictionary first
-        _staging_dict = yaml.safe_load(open(self._staging_file, encoding='utf-8'))
-        _staging_dict[item_type][identifier] = stage
+            ) from e
+
+        _items = _staging_dict[item_type]
+
+        for identifier in identifiers:
+            if identifier not in _items:
+                raise fdp_exc.StagingError(
+                    f"Cannot stage '{item_type}' with label '{identifier}', "
+                    "item does not exist."
+                )
 
-        with open(self._staging_file, encoding='utf-8', mode= "w") as f:
-            yaml.dump(_staging_dict, f)
+        # All identifiers are known so the statuses can be set in one call
+        _items.update(dict.fromkeys(identifiers, stage))
+
+        self._write_staging(_staging_dict)
 
     def is_in_staging_dict(self, identifier, item_type):
         # Open the staging dictionary first
-        _staging_dict = yaml.safe_load(open(self._staging_file, encoding='utf-8'))
+        _staging_dict = self._load_staging()
 
         if identifier in _staging_dict[item_type]:
             return True
@@ -173,8 +288,7 @@ class Stager:
                 f"Failed to recognise job with ID '{job_id}'"
             )
 
-        self.add_to_staging(job_id, "job")
-        self.change_stage_status(job_id, "job", stage)
+        self.add_to_staging(job_id, "job", stage)
 
     def find_registry_entry_for_file(
         self, local_uri: str, file_path: str
@@ -328,17 +442,9 @@ class Stager:
             fdp_conf.get_local_uri(), _config_rel_path
         )["url"]
 
-        # Check for job script file
-        _config_yaml = os.path.join(_directory, fdp_com.USER_CONFIG_FILE)
-        if not os.path.exists(_config_yaml):
-            raise fdp_exc.FileNotFoundError(
-                f"Cannot stage job '{identifier}' "
-                f"Expected config.yaml in '{_directory}'"
-            )
-
         # Find this job script on the local registry, as the script
         # can have any name obtain this information from the config.yaml
-        _config_dict = yaml.safe_load(open(_config_yaml, encoding='utf-8'))
+        _config_dict = fdp_com.read_yaml(_config_yaml)
 
         if (
             "run_metadata" not in _config_dict
@@ -347,9 +453,7 @@ class Stager:
             _script_url = None
         else:
 
-            _script_url = self._extracted_from_get_job_data_50(
-                _config_dict, local_uri
-            )
+            _script_url = self._find_job_script_url(_config_dict, local_uri)
         self._logger.debug("Retrieving code runs and written objects")
 
         _code_run_urls = self._get_code_run_entries(local_uri, _directory)
@@ -364,8 +468,7 @@ class Stager:
             "script_file": _script_url,
         }
 
-    # TODO Rename this here and in `get_job_data`
-    def _extracted_from_get_job_data_50(self, _config_dict, local_uri):
+    def _find_job_script_url(self, _config_dict, local_uri):
         # Find the relevant script path on the local registry, this involves
         # firstly getting the path commencing from the 'jobs' folder
         self._logger.debug("Finding job script within local registry")
@@ -394,7 +497,7 @@ class Stager:
                 type of stage item either job (default) or file
         """
         # Open the staging dictionary first
-        _staging_dict = yaml.safe_load(open(self._staging_file, encoding='utf-8'))
+        _staging_dict = self._read_staging()
 
         if stage_type not in _staging_dict:
             raise fdp_exc.StagingError(
@@ -409,8 +512,7 @@ class Stager:
 
         del _staging_dict[stage_type][identifier]
 
-        with open(self._staging_file, encoding='utf-8', mode= "w") as f:
-            yaml.dump(_staging_dict, f)
+        self._write_staging(_staging_dict)
 
     def get_item_list(
         self, staged: bool = True, stage_type: str = "job"
@@ -424,7 +526,7 @@ class Stager:
             stage_type : str, optional
                 type of stage item either job (default) or file
         """
-        _staging_dict = yaml.safe_load(open(self._staging_file, encoding='utf-8'))
+        _staging_dict = self._load_staging()
 
         if stage_type not in _staging_dict:
             raise fdp_exc.StagingError(
@@ -433,10 +535,41 @@ class Stager:
 
         return [k for k, v in _staging_dict[stage_type].items() if v == staged]
 
+    def get_item_lists(
+        self, stage_type: str = "job"
+    ) -> typing.Tuple[typing.List[str], typing.List[str]]:
+        """Returns lists of staged and unstaged items of type 'stage_type'
+
+        The staging file is read once and partitioned in a single pass.
+
+        Parameters
+        ----------
+            stage_type : str, optional
+                type of stage item either job (default) or file
+
+        Returns
+        -------
+        typing.Tuple[typing.List[str], typing.List[str]]
+            staged items, unstaged items
+        """
+        _staging_dict = self._load_staging()
+
+        if stage_type not in _staging_dict:
+            raise fdp_exc.StagingError(
+                f"Cannot remove staging item of unrecognised type '{stage_type}'"
+            )
+
+        _staged: typing.List[str] = []
+        _unstaged: typing.List[str] = []
+
+        for item, is_staged in _staging_dict[stage_type].items():
+            (_staged if is_staged else _unstaged).append(item)
+
+        return _staged, _unstaged
+
     def update_data_product_staging(self) -> None:
         """Update DataProduct list in staging file."""
-        with open(self._staging_file, encoding='utf-8') as f:
-            _staging_dict = yaml.safe_load(f)
+        _staging_dict = self._read_staging()
 
         result = fdp_req.url_get(
             f"{fdp_com.DEFAULT_LOCAL_REGISTRY_URL}data_product",
@@ -453,13 +586,11 @@ class Stager:
             if key not in _staging_dict["data_product"]:
                 _staging_dict["data_product"][key] = False
 
-        with open(self._staging_file, encoding='utf-8', mode= "w") as f:
-            yaml.dump(_staging_dict, f)
+        self._write_staging(_staging_dict)
 
     def update_code_run_staging(self) -> None:
         """Update code_run(s) list in staging file."""
-        with open(self._staging_file, encoding='utf-8') as f:
-            _staging_dict = yaml.safe_load(f)
+        _staging_dict = self._read_staging()
 
         result = fdp_req.url_get(
             f"{fdp_com.DEFAULT_LOCAL_REGISTRY_URL}code_run",
@@ -471,15 +602,4 @@ class Stager:
             if key not in _staging_dict["code_run"]:
                 _staging_dict["code_run"][key] = False
 
-        with open(self._staging_file, encoding='utf-8', mode="w") as f:
-            yaml.dump(_staging_dict, f)
-
-    def _load_from_file(self, file_name: str = None) -> typing.Dict[str, bool]:
-        if not file_name:
-            file_name = self._staging_file
-
-        with open(file_name, encoding='utf-8', mode= "w") as f:
-            _staging_dict = yaml.safe_load(f)
-
-        self._staging_file = file_name
-        return _staging_dict
+        self._write_staging(_staging_dict)
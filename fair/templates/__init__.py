@@ -6,20 +6,60 @@ FAIR-CLI Templates
 
 Contains methods for assembling templates towards creation of configurations
 and user information displays.
+
+Templates are loaded through a single Jinja environment and are only compiled
+the first time they are accessed, the compiled template is then reused. The
+compiled bytecode is also cached on disk so later invocations of the CLI can
+skip compilation altogether.
+
+Contents
+========
+
+Members
+-------
+
+    config_template - template for a starter user 'config.yaml'
+    hist_template   - template for a job history entry
 """
 
 __date__ = "2021-06-24"
 
 import os
+import typing
 
 import jinja2
 
 templates_dir = os.path.dirname(__file__)
 
-config_template = jinja2.Template(
-    open(os.path.join(templates_dir, "config.jinja"), encoding='utf-8').read()
-)
+_TEMPLATE_FILES: typing.Dict[str, str] = {
+    "config_template": "config.jinja",
+    "hist_template": "hist.jinja",
+}
 
-hist_template = jinja2.Template(
-    open(os.path.join(templates_dir, "hist.jinja"), encoding='utf-8').read()
+
+def _bytecode_cache() -> typing.Optional[jinja2.BytecodeCache]:
+    # The default cache location is a per-user directory in the system
+    # temporary folder, if this cannot be used templates are compiled each time
+    try:
+        return jinja2.FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
+# Template sources are packaged with the CLI and never change during a
+# session, so there is no need for Jinja to check them for modification.
+# Cached bytecode is keyed on a checksum of the template source, so an
+# updated template is always recompiled
+_environment = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(templates_dir, encoding="utf-8"),
+    auto_reload=False,
+    bytecode_cache=_bytecode_cache(),
 )
+
+
+def __getattr__(name: str) -> jinja2.Template:
+    if name not in _TEMPLATE_FILES:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    _template = _environment.get_template(_TEMPLATE_FILES[name])
+    globals()[name] = _template
+    return _template
@@ -26,6 +26,7 @@ Classes
 """
 
 
+import collections
 import itertools
 
 __date__ = "2021-09-10"
@@ -39,7 +40,6 @@ import os.path
 import platform
 import re
 import subprocess
-import sys
 import typing
 from collections.abc import MutableMapping
 
@@ -72,6 +72,10 @@ JOB2CLI_MAPPINGS = {
     "run_metadata.write_data_store": "registries.local.data_store",
 }
 
+# Number of trailing lines of job output logged when a job command fails,
+# the complete output is always written to the job log file
+FAILED_JOB_LOG_LINES = 50
+
 SHELLS: typing.Dict[str, str] = {
     "pwsh": {"exec": "pwsh -command \". '{0}'\"", "extension": "ps1"},
     "batch": {"exec": "{0}", "extension": "bat"},
@@ -113,7 +117,7 @@ class JobConfiguration(MutableMapping):
                 )
 
             self._logger.debug("Loading file '%s'", config_yaml)
-            self._config: typing.Dict = yaml.safe_load(open(config_yaml, encoding='utf-8'))
+            self._config = fdp_com.read_yaml(config_yaml)
 
         self._fill_missing()
 
@@ -727,8 +731,7 @@ class JobConfiguration(MutableMapping):
     def _create_log(self, command: str = None) -> None:
         _logs_dir = fdp_hist.history_directory(self.local_repository)
 
-        if not os.path.exists(_logs_dir):
-            os.makedirs(_logs_dir)
+        os.makedirs(_logs_dir, exist_ok=True)
 
         _time_stamp = self._now.strftime("%Y-%m-%d_%H_%M_%S_%f")
         self._log_file_path = os.path.join(_logs_dir, f"job_{_time_stamp}.log")
@@ -932,7 +935,7 @@ class JobConfiguration(MutableMapping):
                 _config_str = re.sub(subst, str(_value), _config_str)
                 self._logger.debug("Substituting %s: %s", var, str(_value))
 
-        self._config = yaml.safe_load(_config_str)
+        self._config = yaml.load(_config_str, Loader=fdp_com.YAML_LOADER)
 
     def _register_to_read(
         self, register_block: typing.List[typing.Dict]
@@ -1363,7 +1366,11 @@ class JobConfiguration(MutableMapping):
 
         self._logger.debug("Executing command: %s", _exec)
 
-        _log_tail: typing.List[str] = []
+        # Only the end of the output is reported on failure, the full output
+        # is in the job log, so there is no need to hold all of it in memory
+        _log_tail: typing.Deque[str] = collections.deque(
+            maxlen=FAILED_JOB_LOG_LINES
+        )
 
         _process = subprocess.Popen(
             _exec.split(),
@@ -1379,20 +1386,24 @@ class JobConfiguration(MutableMapping):
         )
 
         # Write any stdout to the job log
+        # the log file handle is held open for the whole job, and click.echo
+        # already flushes stdout after each write
         for line in iter(_process.stdout.readline, ""):
-            self._log_file.writelines([line])
+            self._log_file.write(line)
             _log_tail.append(line)
             click.echo(line, nl=False)
-            sys.stdout.flush()
 
         _process.wait()
 
         if _process.returncode != 0:
             self.close_log()
             self._logger.error(
-                "Command '%s' failed with exit code %s, log tail:\n\t%s",
+                "Command '%s' failed with exit code %s, last %s lines of "
+                "output (full output in '%s'):\n\t%s",
                 _exec,
                 _process.returncode,
+                len(_log_tail),
+                self._log_file_path,
                 "\n\t".join(_log_tail),
             )
             raise fdp_exc.CommandExecutionError(
@@ -311,13 +311,13 @@ class UserConfigModel(pydantic.BaseModel):
         extra = "forbid"
 
 
-if __name__ in "__main__":
+if __name__ == "__main__":
     import argparse
 
-    import yaml
+    import fair.common as fdp_com
 
     parser = argparse.ArgumentParser()
     parser.add_argument("in_file")
 
-    _data = yaml.safe_load(open(parser.parse_args().in_file, encoding='utf-8'))
+    _data = fdp_com.read_yaml(parser.parse_args().in_file)
     UserConfigModel(**_data)
@@ -25,8 +25,9 @@ import requests
 import yaml
 
 import fair.common as fdp_com
+import fair.exceptions
 import fair.staging
-from fair.cli import cli
+from fair.cli import cli, complete_data_products, complete_yamls
 from tests import conftest as conf
 
 LOCAL_REGISTRY_URL = "http://127.0.0.1:8000/api"
@@ -217,6 +218,18 @@ def test_init_from_env(
     assert _result.exit_code == 0
     assert os.path.exists(os.path.join(os.getcwd(), fdp_com.FAIR_FOLDER))
 
+@pytest.mark.faircli_cli
+def test_init_using_unreadable(
+    click_test: click.testing.CliRunner,
+    mocker: pytest_mock.MockerFixture,
+    tmp_path,
+):
+    _session = mocker.patch("fair.session.FAIR")
+    _result = click_test.invoke(cli, ["init", "--using", str(tmp_path)])
+    assert _result.exit_code != 0
+    assert "Cannot load CLI configuration" in _result.output
+    _session.return_value.__enter__.return_value.initialise.assert_not_called()
+
 @pytest.mark.faircli_cli
 def test_init_full(
     local_registry: conf.RegistryTest,
@@ -402,6 +415,245 @@ def test_purge(
         os.path.join(local_config[0], fdp_com.FAIR_FOLDER)
     )
 
+
+@pytest.mark.faircli_cli
+def test_purge_yes(
+    local_config: typing.Tuple[str, str],
+    click_test: click.testing.CliRunner,
+    mocker: pytest_mock.MockerFixture,
+):
+    mocker.patch(
+        "fair.common.global_config_dir", lambda *args: local_config[0]
+    )
+    mocker.patch("fair.common.find_fair_root", lambda *args: local_config[1])
+    mocker.patch("click.confirm", lambda *args, **kwargs: False)
+
+    _result = click_test.invoke(cli, ["purge", "--yes"])
+    assert _result.exit_code == 0
+    assert not os.path.exists(
+        os.path.join(local_config[1], fdp_com.FAIR_FOLDER)
+    )
+
+@pytest.mark.faircli_cli
+def test_complete_yamls(tmp_path, mocker: pytest_mock.MockerFixture):
+    os.makedirs(os.path.join(tmp_path, "sub"))
+    os.makedirs(os.path.join(tmp_path, ".git"))
+    os.makedirs(os.path.join(tmp_path, fdp_com.FAIR_FOLDER))
+    for _file in (
+        "a.yaml",
+        os.path.join("sub", "b.yml"),
+        "c.txt",
+        os.path.join(".git", "d.yaml"),
+        os.path.join(fdp_com.FAIR_FOLDER, "e.yaml"),
+    ):
+        Path(os.path.join(tmp_path, _file)).touch()
+    mocker.patch("os.getcwd", lambda: str(tmp_path))
+    _items = complete_yamls(None, None, str(tmp_path))
+    assert sorted(i.value for i in _items) == [
+        os.path.join(tmp_path, "a.yaml"),
+        os.path.join(tmp_path, "sub", "b.yml"),
+    ]
+    _items = complete_yamls(None, None, os.path.join(tmp_path, "sub", ""))
+    assert [i.value for i in _items] == [os.path.join(tmp_path, "sub", "b.yml")]
+    _items = complete_yamls(None, None, "")
+    assert sorted(i.value for i in _items) == [
+        "a.yaml",
+        os.path.join("sub", "b.yml"),
+    ]
+    _items = complete_yamls(None, None, os.path.join("sub", ""))
+    assert [i.value for i in _items] == [os.path.join("sub", "b.yml")]
+    _items = complete_yamls(None, None, os.path.join(".", "su"))
+    assert [i.value for i in _items] == [os.path.join(".", "sub", "b.yml")]
+    _items = complete_yamls(None, None, os.path.join(".git", ""))
+    assert [i.value for i in _items] == [os.path.join(".git", "d.yaml")]
+
+@pytest.mark.faircli_cli
+def test_complete_data_products(
+    local_config: typing.Tuple[str, str],
+    mocker: pytest_mock.MockerFixture,
+):
+    mocker.patch("fair.common.find_fair_root", lambda *args: local_config[1])
+    mocker.patch("os.getcwd", lambda: local_config[1])
+    _stager = fair.staging.Stager(local_config[1])
+    _stager.initialise()
+    _stager.add_to_staging_many(
+        ["testing:data@v0.1.0", "other:data@v0.1.0"], "data_product"
+    )
+    assert os.path.exists(f"{_stager._staging_file}{fdp_com.STAGING_JSON_SUFFIX}")
+    _items = complete_data_products(None, None, "test")
+    assert [i.value for i in _items] == ["testing:data@v0.1.0"]
+    mocker.patch("fair.cli._MAX_COMPLETIONS", 1)
+    assert len(complete_data_products(None, None, "")) == 1
+    os.remove(_stager._staging_file)
+    assert complete_data_products(None, None, "") == []
+
+@pytest.mark.faircli_cli
+def test_registry_uninstall_yes(
+    click_test: click.testing.CliRunner,
+    mocker: pytest_mock.MockerFixture,
+):
+    _uninstall = mocker.patch("fair.registry.server.uninstall_registry")
+    _confirm = mocker.patch("click.confirm", return_value=False)
+
+    _result = click_test.invoke(cli, ["registry", "uninstall", "--yes"])
+    assert _result.exit_code == 0
+    _uninstall.assert_called_once()
+    _confirm.assert_not_called()
+
+@pytest.mark.faircli_cli
+def test_remote_add_no_url(click_test: click.testing.CliRunner):
+    _result = click_test.invoke(cli, ["remote", "add"])
+    assert _result.exit_code != 0
+    assert "Expected either a URL" in _result.output
+
+@pytest.mark.faircli_cli
+def test_config_chained(
+    local_config: typing.Tuple[str, str],
+    click_test: click.testing.CliRunner,
+    mocker: pytest_mock.MockerFixture,
+):
+    _write = mocker.spy(fdp_com, "write_yaml")
+    _result = click_test.invoke(
+        cli,
+        ["config", "user.name", "jane bloggs", "user.email", "jane@nowhere"],
+    )
+    assert _result.exit_code == 0
+    _write.assert_called_once()
+    _user = fdp_com.read_yaml(fdp_com.local_fdpconfig(local_config[1]))["user"]
+    assert _user["given_names"] == "Jane"
+    assert _user["family_name"] == "Bloggs"
+    assert _user["email"] == "jane@nowhere"
+
+@pytest.mark.faircli_cli
+def test_list_subcommand_only(
+    click_test: click.testing.CliRunner,
+    mocker: pytest_mock.MockerFixture,
+):
+    mocker.patch("fair.session.FAIR.__init__", return_value=None)
+    mocker.patch("fair.session.FAIR.__enter__", lambda self: self)
+    mocker.patch("fair.session.FAIR.__exit__", return_value=None)
+    _products = mocker.patch("fair.session.FAIR.show_all_data_products")
+    _runs = mocker.patch("fair.session.FAIR.show_all_code_runs")
+
+    _result = click_test.invoke(cli, ["list", "code-runs"])
+    assert _result.exit_code == 0
+    _products.assert_not_called()
+    _runs.assert_called_once_with(remote="")
+
+@pytest.mark.faircli_cli
+def test_fair_exception_reported(
+    click_test: click.testing.CliRunner,
+    mocker: pytest_mock.MockerFixture,
+):
+    mocker.patch(
+        "fair.session.FAIR.__init__",
+        side_effect=fair.exceptions.FDPRepositoryError("Not a FAIR repository"),
+    )
+    _result = click_test.invoke(cli, ["reset"])
+    assert _result.exit_code == 1
+    assert "Error: Not a FAIR repository" in _result.output
+
+@pytest.mark.faircli_cli
+def test_registry_status_no_session(
+    click_test: click.testing.CliRunner,
+    mocker: pytest_mock.MockerFixture,
+):
+    _session = mocker.patch("fair.session.FAIR")
+    mocker.patch(
+        "fair.configuration.get_local_uri",
+        lambda: "http://127.0.0.1:8000/api/",
+    )
+    _running = mocker.patch(
+        "fair.registry.server.check_server_running", return_value=True
+    )
+    _result = click_test.invoke(cli, ["registry", "status"])
+    assert _result.exit_code == 0
+    assert "Server running at: http://127.0.0.1:8000/api/" in _result.output
+    _running.assert_called_once_with("http://127.0.0.1:8000/api/")
+    _session.assert_not_called()
+
+@pytest.mark.faircli_cli
+def test_version_fast_path(
+    capsys: pytest.CaptureFixture, mocker: pytest_mock.MockerFixture
+):
+    import fair.__main__
+
+    mocker.patch("importlib.metadata.version", lambda *_: "1.2.3")
+    _expected = click.testing.CliRunner().invoke(
+        cli, ["--version"], prog_name="fair"
+    ).output
+    mocker.patch("sys.argv", ["fair", "--version"])
+    _cli = mocker.patch("fair.cli.cli")
+    fair.__main__.main()
+    assert capsys.readouterr().out == _expected == "fair, version 1.2.3\n"
+    _cli.assert_not_called()
+
+@pytest.mark.faircli_cli
+def test_version_fast_path_not_installed(mocker: pytest_mock.MockerFixture):
+    import importlib.metadata
+
+    import fair.__main__
+
+    def _not_installed(*_):
+        raise importlib.metadata.PackageNotFoundError("fair-cli")
+
+    mocker.patch("importlib.metadata.version", _not_installed)
+    mocker.patch("sys.argv", ["fair", "--version"])
+    _cli = mocker.patch("fair.cli.cli")
+    fair.__main__.main()
+    _cli.assert_called_once_with(obj={}, prog_name="fair")
+
+@pytest.mark.faircli_cli
+def test_purge_no_input(
+    local_config: typing.Tuple[str, str],
+    click_test: click.testing.CliRunner,
+    mocker: pytest_mock.MockerFixture,
+):
+    mocker.patch(
+        "fair.common.global_config_dir", lambda *args: local_config[0]
+    )
+    mocker.patch("fair.common.find_fair_root", lambda *args: local_config[1])
+
+    _result = click_test.invoke(cli, ["purge"], input="")
+    assert _result.exit_code == 1
+    assert "fair purge --yes" in _result.output
+    assert os.path.exists(os.path.join(local_config[1], fdp_com.FAIR_FOLDER))
+
+@pytest.mark.faircli_cli
+def test_purge_interrupted(
+    click_test: click.testing.CliRunner,
+    mocker: pytest_mock.MockerFixture,
+):
+    def _interrupt(*args, **kwargs):
+        try:
+            raise KeyboardInterrupt
+        except KeyboardInterrupt:
+            raise click.Abort() from None
+
+    mocker.patch("click.confirm", _interrupt)
+    _session = mocker.patch("fair.session.FAIR")
+    _result = click_test.invoke(cli, ["purge"])
+    assert _result.exit_code == 1
+    assert "Aborted!" in _result.output
+    assert "fair purge --yes" not in _result.output
+    _session.assert_not_called()
+
+@pytest.mark.faircli_cli
+def test_purge_all_declined(
+    local_config: typing.Tuple[str, str],
+    click_test: click.testing.CliRunner,
+    mocker: pytest_mock.MockerFixture,
+):
+    mocker.patch(
+        "fair.common.global_config_dir", lambda *args: local_config[0]
+    )
+    mocker.patch("fair.common.find_fair_root", lambda *args: local_config[1])
+
+    _result = click_test.invoke(cli, ["purge", "--all"], input="n")
+    assert _result.exit_code == 0
+    assert os.path.exists(os.path.join(local_config[0], fdp_com.FAIR_FOLDER))
+    assert os.path.exists(os.path.join(local_config[1], fdp_com.FAIR_FOLDER))
+
 @pytest.mark.faircli_cli
 def test_registry_cli(
     local_config: typing.Tuple[str, str],
@@ -1,4 +1,6 @@
 import os
+import platform
+import stat
 
 import git
 import pytest
@@ -32,6 +34,26 @@ def test_find_fair_root(tmp_path):
     assert fdp_com.find_fair_root(_proj_dir) == tempd
 
 
+@pytest.mark.faircli_common
+def test_find_fair_root_cached(tmp_path):
+    tempd = tmp_path.__str__()
+    _proj_dir = os.path.join(tempd, "project")
+    os.makedirs(os.path.join(tempd, fdp_com.FAIR_FOLDER))
+    os.makedirs(_proj_dir)
+    assert fdp_com.find_fair_root(_proj_dir) == tempd
+
+    # A nested repository is only found once the cache has been cleared
+    os.makedirs(os.path.join(_proj_dir, fdp_com.FAIR_FOLDER))
+    assert fdp_com.find_fair_root(_proj_dir) == tempd
+    fdp_com.clear_fair_root_cache()
+    assert fdp_com.find_fair_root(_proj_dir) == _proj_dir
+
+    # A removed repository is never returned from the cache
+    os.rmdir(os.path.join(_proj_dir, fdp_com.FAIR_FOLDER))
+    os.rmdir(os.path.join(tempd, fdp_com.FAIR_FOLDER))
+    assert not fdp_com.find_fair_root(_proj_dir)
+
+
 @pytest.mark.faircli_common
 def test_staging_cache(tmp_path):
     tempd = tmp_path.__str__()
@@ -85,3 +107,48 @@ def test_registry_home(mocker: pytest_mock.MockerFixture, tmp_path):
             {"registries": {"local": {"directory": "registry"}}}, out_f
         )
     assert fdp_com.registry_home() == "registry"
+
+
+@pytest.mark.faircli_common
+def test_write_yaml(tmp_path):
+    _out_file = os.path.join(tmp_path.__str__(), "out.yaml")
+    fdp_com.write_yaml(_out_file, {"user": {"name": "Joe Bloggs"}})
+    fdp_com.write_yaml(_out_file, {"user": {"name": "Jane Bloggs"}})
+    with open(_out_file) as in_f:
+        assert yaml.safe_load(in_f) == {"user": {"name": "Jane Bloggs"}}
+    assert os.listdir(tmp_path.__str__()) == ["out.yaml"]
+    assert fdp_com.read_yaml(_out_file) == {"user": {"name": "Jane Bloggs"}}
+
+
+@pytest.mark.faircli_common
+@pytest.mark.skipif(platform.system() == "Windows", reason="POSIX permissions")
+def test_write_yaml_symlink_mode(tmp_path):
+    _target = os.path.join(tmp_path.__str__(), "target.yaml")
+    _link = os.path.join(tmp_path.__str__(), "cli-config.yaml")
+    fdp_com.write_yaml(_target, {"user": {"name": "Joe Bloggs"}})
+    os.chmod(_target, 0o600)
+    os.symlink(_target, _link)
+    fdp_com.write_yaml(_link, {"user": {"name": "Jane Bloggs"}})
+    assert os.path.islink(_link)
+    assert fdp_com.read_yaml(_target) == {"user": {"name": "Jane Bloggs"}}
+    assert stat.S_IMODE(os.stat(_target).st_mode) == 0o600
+    assert sorted(os.listdir(tmp_path.__str__())) == [
+        "cli-config.yaml",
+        "target.yaml",
+    ]
+
+
+@pytest.mark.faircli_common
+def test_write_file_sync(tmp_path, mocker: pytest_mock.MockerFixture):
+    _out_file = os.path.join(tmp_path.__str__(), "staging")
+    _fsync = mocker.spy(os, "fsync")
+    _replace = mocker.spy(os, "replace")
+    fdp_com.write_file(_out_file, b"data_product: {}\n")
+    _fsync.assert_called_once()
+    _replace.assert_called_once()
+    assert os.path.basename(_replace.call_args[0][0]) != "staging"
+    assert os.listdir(tmp_path.__str__()) == ["staging"]
+    if platform.system() != "Windows":
+        _umask = os.umask(0)
+        os.umask(_umask)
+        assert stat.S_IMODE(os.stat(_out_file).st_mode) == 0o666 & ~_umask
@@ -81,6 +81,10 @@ def test_user_set(local_config: typing.Tuple[str, str]):
         == "Victor Chester"
     )
     assert fdp_conf.read_global_fdpconfig()["user"]["family_name"] == "Bloggs"
+    assert (
+        fdp_conf.read_global_fdpconfig()["user"]["name"]
+        == "Victor Chester Bloggs"
+    )
 
 
 @pytest.mark.faircli_configuration
@@ -4,6 +4,7 @@ import os
 import pytest
 
 import fair.history as fdp_hist
+import fair.run as fdp_run
 from fair.common import FAIR_FOLDER
 
 
@@ -44,3 +45,11 @@ def test_job_log_show(
     _captured = capsys.readouterr()
     _command = _captured.out.split("\n")[3].split("=")[-1].strip()
     assert _command == "fair pull"
+
+
+@pytest.mark.faircli_history
+def test_job_dir_from_hash(job_directory: str):
+    _hash = hashlib.sha1(job_directory.encode("utf-8")).hexdigest()
+    assert fdp_run.get_job_hashes() == {_hash: job_directory}
+    assert fdp_run.get_job_dir(_hash) == job_directory
+    assert fdp_run.get_job_dir("0" * 40) == ""
@@ -48,6 +48,43 @@ def test_job_status_change(
         assert not any(_dict["job"].values())
 
 
+@pytest.mark.faircli_staging
+def test_change_stage_status_many(stager: fdp_stage.Stager):
+    _ids = sorted(str(uuid.uuid4()) for _ in range(3))
+
+    stager.add_to_staging_many(_ids, "data_product")
+
+    stager.change_stage_status_many(_ids[:2], "data_product", True)
+
+    assert stager.get_item_list(True, "data_product") == _ids[:2]
+    assert stager.get_item_list(False, "data_product") == _ids[2:]
+    assert stager.get_item_lists("data_product") == (_ids[:2], _ids[2:])
+
+    with pytest.raises(fdp_exc.StagingError):
+        stager.change_stage_status_many(
+            [_ids[2], "not-an-item"], "data_product", True
+        )
+
+    assert stager.get_item_list(False, "data_product") == _ids[2:]
+
+
+@pytest.mark.faircli_staging
+def test_read_staging_cache(stager: fdp_stage.Stager):
+    _id = str(uuid.uuid4())
+    stager.add_to_staging(_id, "data_product")
+
+    # Modifying the returned dictionary must not affect later reads
+    stager._read_staging()["data_product"].clear()
+    assert _id in stager._read_staging()["data_product"]
+
+    # Changes made to the file outside of the stager must be picked up
+    _staging_dict = stager._read_staging()
+    _staging_dict["data_product"][_id] = True
+    with open(stager._staging_file, "w") as stage_f:
+        yaml.dump(_staging_dict, stage_f)
+    assert stager.get_item_list(True, "data_product") == [_id]
+
+
 @pytest.mark.faircli_staging
 def test_registry_entry_for_file(
     stager: fdp_stage.Stager, mocker: pytest_mock.MockerFixture
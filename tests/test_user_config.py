@@ -1,4 +1,7 @@
+import datetime
+import logging
 import os.path
+import platform
 import typing
 
 import pytest
@@ -6,6 +9,7 @@ import pytest_mock
 import yaml
 
 import fair.common as fdp_com
+import fair.exceptions as fdp_exc
 import fair.user_config as fdp_user
 
 from . import conftest as conf
@@ -190,3 +194,43 @@ def test_wildcard_unpack_remote(
         assert len(_config["read"]) > 1
 
         _config.write(os.path.join(_out_dir, "out.yaml"))
+
+
+@pytest.mark.faircli_user_config
+@pytest.mark.skipif(
+    platform.system() == "Windows", reason="Job script is a POSIX shell script"
+)
+def test_execute_failure_log_tail(
+    tmp_path,
+    mocker: pytest_mock.MockerFixture,
+    caplog: pytest.LogCaptureFixture,
+):
+    _script = os.path.join(tmp_path, "script.sh")
+    with open(_script, "w") as out_f:
+        out_f.write("for i in $(seq 1 60); do echo \"line $i\"; done\nexit 3\n")
+    mocker.patch("fair.configuration.get_current_user_name", lambda *_: ("A",))
+    mocker.patch("fair.configuration.get_current_user_email", lambda *_: "a@b")
+    _log_path = os.path.join(tmp_path, "job.log")
+    _job = mocker.MagicMock(
+        command="sh",
+        shell="sh",
+        script=_script,
+        env=dict(os.environ),
+        local_repository=str(tmp_path),
+        _now=datetime.datetime.now(),
+        _log_file=open(_log_path, "w"),
+        _log_file_path=_log_path,
+        _logger=logging.getLogger("FAIRDataPipeline.ConfigYAML"),
+    )
+    with caplog.at_level(logging.ERROR, logger="FAIRDataPipeline.ConfigYAML"):
+        with pytest.raises(fdp_exc.CommandExecutionError):
+            fdp_user.JobConfiguration.execute(_job)
+    _job._log_file.close()
+    _message = caplog.records[-1].getMessage()
+    _skipped = 60 - fdp_user.FAILED_JOB_LOG_LINES
+    assert f"last {fdp_user.FAILED_JOB_LOG_LINES} lines" in _message
+    assert f"line {_skipped + 1}\n" in _message
+    assert f"line {_skipped}\n" not in _message
+    assert _log_path in _message
+    with open(_log_path) as in_f:
+        assert "line 1\n" in in_f.read()